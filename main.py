@@ -30,18 +30,197 @@ Features:
         * Save As  -> same, but prompts for path
 """
 
-import json
+from __future__ import annotations
+
+import functools
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from PyQt5 import QtCore, QtGui, QtWidgets
 
 from room_tab import RoomTab
-from summary_tab import SummaryTab
-from models import ShowPlan, RoomPlan
+from models import (
+    MediaCue,
+    RoomCuesMixin,
+    ShowPlan,
+    loads_json,
+)
+
+if TYPE_CHECKING:
+    # Imported lazily in _ensure_summary_tab; only needed here for typing.
+    from summary_tab import SummaryTab
+
+
+# Stylesheets live at module level so they're built once. _MAIN_QSS is
+# applied to the QApplication before any widgets exist (see main()), so
+# every widget picks it up on first polish instead of being re-polished.
+_MAIN_QSS = """
+QMainWindow {
+    background-color: #0a121e;
+}
+QMenuBar {
+    background-color: #0a121e;
+    color: #e6ebf5;
+}
+QMenuBar::item {
+    background: transparent;
+    color: #e6ebf5;
+}
+QMenuBar::item:selected {
+    background: #1f2f4a;
+}
+QMenu {
+    background-color: #0f1826;
+    color: #e6ebf5;
+    border: 1px solid #283754;
+}
+QMenu::item:selected {
+    background-color: #254064;
+}
+QTabWidget::pane {
+    border: 1px solid #1f2a3e;
+}
+QTabBar::tab {
+    background: #182338;
+    color: #e6ebf5;
+    padding: 6px 10px;
+}
+QTabBar::tab:selected {
+    background: #1f2f4a;
+}
+QHeaderView::section {
+    background-color: #1f2f4a;
+    color: #e6ebf5;
+    padding: 4px;
+    border: 1px solid #141c2b;
+}
+QGroupBox {
+    border: 1px solid #1f2a3e;
+    border-radius: 4px;
+    margin-top: 8px;
+    background-color: #111a29;
+}
+QGroupBox::title {
+    subcontrol-origin: margin;
+    left: 10px;
+    padding: 0 3px 0 3px;
+}
+QTableView {
+    gridline-color: #283754;
+    background-color: #0f1826;
+    alternate-background-color: #182338;
+    color: #e6ebf5;
+    selection-background-color: #005a9e;
+    selection-color: #ffffff;
+}
+QLineEdit, QDoubleSpinBox, QComboBox {
+    background-color: #0f1826;
+    color: #e6ebf5;
+    border: 1px solid #283754;
+    border-radius: 2px;
+    padding: 2px 4px;
+}
+QPushButton {
+    background-color: #1f2f4a;
+    color: #e6ebf5;
+    border: 1px solid #283754;
+    border-radius: 3px;
+    padding: 4px 10px;
+}
+QPushButton:hover {
+    background-color: #254064;
+}
+QPushButton:pressed {
+    background-color: #1a2940;
+}
+"""
+
+# Readable light popup for the About dialog
+_ABOUT_QSS = """
+QMessageBox {
+    background-color: #e6e6e6;      /* light grey popup */
+}
+QMessageBox QLabel {
+    color: #0A0A0A;                 /* dark text */
+    font-size: 12pt;
+}
+QPushButton {
+    background-color: #1f2f4a;
+    color: #e6ebf5;
+    border: 1px solid #283754;
+    border-radius: 3px;
+    padding: 4px 10px;
+}
+QPushButton:hover {
+    background-color: #254064;
+}
+QPushButton:pressed {
+    background-color: #1a2940;
+}
+"""
+
+
+@functools.cache
+def _build_dark_palette() -> QtGui.QPalette:
+    """Build the dark-navy palette once; later calls reuse the same object."""
+    palette = QtGui.QPalette()
+
+    # Dark navy base colors
+    window_color = QtGui.QColor(10, 18, 30)      # main window background
+    base_color = QtGui.QColor(15, 24, 38)        # text entry / tables
+    alt_base_color = QtGui.QColor(22, 34, 52)    # alternating rows
+    button_color = QtGui.QColor(25, 40, 65)      # buttons, group boxes
+    text_color = QtGui.QColor(230, 235, 245)     # almost white, but softer
+
+    palette.setColor(QtGui.QPalette.Window, window_color)
+    palette.setColor(QtGui.QPalette.WindowText, text_color)
+    palette.setColor(QtGui.QPalette.Base, base_color)
+    palette.setColor(QtGui.QPalette.AlternateBase, alt_base_color)
+    palette.setColor(QtGui.QPalette.ToolTipBase, base_color)
+    palette.setColor(QtGui.QPalette.ToolTipText, text_color)
+    palette.setColor(QtGui.QPalette.Text, text_color)
+    palette.setColor(QtGui.QPalette.Button, button_color)
+    palette.setColor(QtGui.QPalette.ButtonText, text_color)
+    palette.setColor(QtGui.QPalette.BrightText, QtCore.Qt.red)
+
+    # Highlights in a clean blue
+    highlight = QtGui.QColor(0, 122, 204)
+    palette.setColor(QtGui.QPalette.Highlight, highlight)
+    palette.setColor(QtGui.QPalette.HighlightedText, QtCore.Qt.white)
+
+    # Disabled-state colors
+    disabled_text = QtGui.QColor(140, 150, 170)
+    palette.setColor(QtGui.QPalette.Disabled, QtGui.QPalette.Text, disabled_text)
+    palette.setColor(QtGui.QPalette.Disabled, QtGui.QPalette.ButtonText, disabled_text)
+    palette.setColor(QtGui.QPalette.Disabled, QtGui.QPalette.WindowText, disabled_text)
+
+    return palette
+
+
+class RoomPlaceholder(QtWidgets.QWidget, RoomCuesMixin):
+    """
+    Lightweight stand-in for a RoomTab that hasn't been opened yet.
+
+    Building a full RoomTab (form, table, timeline) is the bulk of startup
+    time, so each room starts as one of these. It holds the room's cues so
+    saving, loading and the summary all work without the real editor; the
+    MainWindow swaps in a RoomTab the first time the tab is shown.
+    """
+
+    def __init__(self, room_name: str, parent: QtWidgets.QWidget | None = None) -> None:
+        super().__init__(parent)
+        self.room_name = room_name
+        self._init_cues()
+
+    def set_cues(self, cues: list[MediaCue]) -> None:
+        """Replace the cue list (shown once the real RoomTab is built)."""
+        self._replace_cues(cues)
 
 
 class MainWindow(QtWidgets.QMainWindow):
+    _BASE_TITLE = "Ash's Cue Planner – Simple"
+
     def __init__(self) -> None:
         super().__init__()
 
@@ -49,19 +228,29 @@ class MainWindow(QtWidgets.QMainWindow):
         self.resize(1200, 750)
 
         self.current_path: Path | None = None
+        # " [file.json]" for the title bar, kept in sync with current_path
+        self._title_suffix: str = ""
 
         # Central widget: tabbed interface for all rooms + summary
         self.tab_widget = QtWidgets.QTabWidget()
         self.setCentralWidget(self.tab_widget)
 
-        # Keep references to all RoomTab instances for saving/loading
-        self.room_tabs: list[RoomTab] = []
+        # One entry per room, in tab order. Rooms start as placeholders and
+        # are replaced in-place by a RoomTab when first shown.
+        self.room_tabs: list[RoomTab | RoomPlaceholder] = []
         self.summary_tab: SummaryTab | None = None
 
         self._create_tabs()
         self._create_menus()
         self._apply_basic_theme()
 
+        # Tab switches can arrive in bursts (fast clicking, tab swaps), so
+        # summary refreshes are coalesced through a short single-shot timer.
+        self._summary_refresh_timer = QtCore.QTimer(self)
+        self._summary_refresh_timer.setSingleShot(True)
+        self._summary_refresh_timer.setInterval(50)
+        self._summary_refresh_timer.timeout.connect(self._refresh_summary_now)
+
         # Refresh summary when switching to the summary tab
         self.tab_widget.currentChanged.connect(self._on_tab_changed)
 
@@ -70,7 +259,10 @@ class MainWindow(QtWidgets.QMainWindow):
     # ------------------------------------------------------------------
     def _create_tabs(self) -> None:
         """
-        Create a RoomTab for each room in the show, plus a Summary tab.
+        Create a tab for each room in the show, plus a Summary tab.
+
+        Only the first room gets a real RoomTab up front; the others are
+        placeholders until the user opens them (see _ensure_room_tab).
 
         Order is important and matches the physical flow:
             Reception
@@ -96,13 +288,61 @@ class MainWindow(QtWidgets.QMainWindow):
         ]
 
         for name in room_names:
-            tab = RoomTab(name, self)
+            tab = RoomPlaceholder(name, self)
             self.tab_widget.addTab(tab, name)
             self.room_tabs.append(tab)
 
-        # Summary tab at the end
-        self.summary_tab = SummaryTab(self.room_tabs, self)
-        self.tab_widget.addTab(self.summary_tab, "Summary")
+        # Summary tab at the end; its module is only imported (and the tab
+        # only built) the first time it is opened.
+        self._summary_index = self.tab_widget.addTab(QtWidgets.QWidget(self), "Summary")
+
+        # The first room is visible straight away
+        self._ensure_room_tab(0)
+
+    def _ensure_room_tab(self, index: int) -> RoomTab | None:
+        """
+        Make sure the room at `index` is a real RoomTab, building it from
+        its placeholder if needed. Returns None for non-room indices.
+        """
+        if not 0 <= index < len(self.room_tabs):
+            return None
+
+        placeholder = self.room_tabs[index]
+        if isinstance(placeholder, RoomTab):
+            return placeholder
+
+        name = placeholder.room_name
+        tab = RoomTab(name, self)
+        cues = placeholder.get_cues()
+        if cues:
+            tab.set_cues(cues)
+
+        self._replace_tab(index, tab, name)
+        self.room_tabs[index] = tab
+        return tab
+
+    def _ensure_summary_tab(self) -> SummaryTab:
+        """Build the Summary tab (importing its module) if not done yet."""
+        if self.summary_tab is None:
+            from summary_tab import SummaryTab
+
+            self.summary_tab = SummaryTab(self.room_tabs, self)
+            self._replace_tab(self._summary_index, self.summary_tab, "Summary")
+        return self.summary_tab
+
+    def _replace_tab(self, index: int, widget: QtWidgets.QWidget, label: str) -> None:
+        """Swap the page at `index` for `widget`, keeping the current tab."""
+        old = self.tab_widget.widget(index)
+
+        # Swapping the page would otherwise emit currentChanged re-entrantly
+        current = self.tab_widget.currentIndex()
+        self.tab_widget.blockSignals(True)
+        self.tab_widget.removeTab(index)
+        self.tab_widget.insertTab(index, widget, label)
+        self.tab_widget.setCurrentIndex(current)
+        self.tab_widget.blockSignals(False)
+
+        old.deleteLater()
 
     # ------------------------------------------------------------------
     # Menus
@@ -168,28 +408,7 @@ class MainWindow(QtWidgets.QMainWindow):
         msg.setText(text)
 
         # Force the popup to have a decent readable style
-        msg.setStyleSheet("""
-            QMessageBox {
-                background-color: #e6e6e6;      /* light grey popup */
-            }
-            QMessageBox QLabel {
-                color: #0A0A0A;                 /* dark text */
-                font-size: 12pt;
-            }
-            QPushButton {
-                background-color: #1f2f4a;
-                color: #e6ebf5;
-                border: 1px solid #283754;
-                border-radius: 3px;
-                padding: 4px 10px;
-            }
-            QPushButton:hover {
-                background-color: #254064;
-            }
-            QPushButton:pressed {
-                background-color: #1a2940;
-            }
-        """)
+        msg.setStyleSheet(_ABOUT_QSS)
         msg.exec_()
 
 
@@ -199,136 +418,32 @@ class MainWindow(QtWidgets.QMainWindow):
     def _apply_basic_theme(self) -> None:
         """
         Apply a dark-blue theme similar to the other tools.
+
+        Only the palette is set here; the matching stylesheet (_MAIN_QSS)
+        is installed on the QApplication in main().
         """
         app = QtWidgets.QApplication.instance()
         if app is None:
             return
 
-        palette = QtGui.QPalette()
-
-        # Dark navy base colors
-        window_color = QtGui.QColor(10, 18, 30)      # main window background
-        base_color = QtGui.QColor(15, 24, 38)        # text entry / tables
-        alt_base_color = QtGui.QColor(22, 34, 52)    # alternating rows
-        button_color = QtGui.QColor(25, 40, 65)      # buttons, group boxes
-        text_color = QtGui.QColor(230, 235, 245)     # almost white, but softer
-
-        palette.setColor(QtGui.QPalette.Window, window_color)
-        palette.setColor(QtGui.QPalette.WindowText, text_color)
-        palette.setColor(QtGui.QPalette.Base, base_color)
-        palette.setColor(QtGui.QPalette.AlternateBase, alt_base_color)
-        palette.setColor(QtGui.QPalette.ToolTipBase, base_color)
-        palette.setColor(QtGui.QPalette.ToolTipText, text_color)
-        palette.setColor(QtGui.QPalette.Text, text_color)
-        palette.setColor(QtGui.QPalette.Button, button_color)
-        palette.setColor(QtGui.QPalette.ButtonText, text_color)
-        palette.setColor(QtGui.QPalette.BrightText, QtCore.Qt.red)
-
-        # Highlights in a clean blue
-        highlight = QtGui.QColor(0, 122, 204)
-        palette.setColor(QtGui.QPalette.Highlight, highlight)
-        palette.setColor(QtGui.QPalette.HighlightedText, QtCore.Qt.white)
-
-        # Disabled-state colors
-        disabled_text = QtGui.QColor(140, 150, 170)
-        palette.setColor(QtGui.QPalette.Disabled, QtGui.QPalette.Text, disabled_text)
-        palette.setColor(QtGui.QPalette.Disabled, QtGui.QPalette.ButtonText, disabled_text)
-        palette.setColor(QtGui.QPalette.Disabled, QtGui.QPalette.WindowText, disabled_text)
-
-        app.setPalette(palette)
-
-        # Slightly tweak menus, table header, group boxes, etc. via stylesheet
-        self.setStyleSheet("""
-        QMainWindow {
-            background-color: #0a121e;
-        }
-        QMenuBar {
-            background-color: #0a121e;
-            color: #e6ebf5;
-        }
-        QMenuBar::item {
-            background: transparent;
-            color: #e6ebf5;
-        }
-        QMenuBar::item:selected {
-            background: #1f2f4a;
-        }
-        QMenu {
-            background-color: #0f1826;
-            color: #e6ebf5;
-            border: 1px solid #283754;
-        }
-        QMenu::item:selected {
-            background-color: #254064;
-        }
-        QTabWidget::pane {
-            border: 1px solid #1f2a3e;
-        }
-        QTabBar::tab {
-            background: #182338;
-            color: #e6ebf5;
-            padding: 6px 10px;
-        }
-        QTabBar::tab:selected {
-            background: #1f2f4a;
-        }
-        QHeaderView::section {
-            background-color: #1f2f4a;
-            color: #e6ebf5;
-            padding: 4px;
-            border: 1px solid #141c2b;
-        }
-        QGroupBox {
-            border: 1px solid #1f2a3e;
-            border-radius: 4px;
-            margin-top: 8px;
-            background-color: #111a29;
-        }
-        QGroupBox::title {
-            subcontrol-origin: margin;
-            left: 10px;
-            padding: 0 3px 0 3px;
-        }
-        QTableWidget {
-            gridline-color: #283754;
-            background-color: #0f1826;
-            alternate-background-color: #182338;
-            color: #e6ebf5;
-            selection-background-color: #005a9e;
-            selection-color: #ffffff;
-        }
-        QLineEdit, QDoubleSpinBox, QComboBox {
-            background-color: #0f1826;
-            color: #e6ebf5;
-            border: 1px solid #283754;
-            border-radius: 2px;
-            padding: 2px 4px;
-        }
-        QPushButton {
-            background-color: #1f2f4a;
-            color: #e6ebf5;
-            border: 1px solid #283754;
-            border-radius: 3px;
-            padding: 4px 10px;
-        }
-        QPushButton:hover {
-            background-color: #254064;
-        }
-        QPushButton:pressed {
-            background-color: #1a2940;
-        }
-        """)
+        app.setPalette(_build_dark_palette())
 
     # ------------------------------------------------------------------
     # File operations
     # ------------------------------------------------------------------
     def _new_file(self) -> None:
         """Clear all cues in all rooms and reset current path."""
-        for tab in self.room_tabs:
-            tab.set_cues([])
-        if self.summary_tab is not None:
-            self.summary_tab.refresh_summary()
+        # Freeze painting while every room is reset, then repaint once
+        self.tab_widget.setUpdatesEnabled(False)
+        try:
+            for tab in self.room_tabs:
+                tab.set_cues([])
+            if self.summary_tab is not None:
+                self.summary_tab.refresh_summary()
+        finally:
+            self.tab_widget.setUpdatesEnabled(True)
         self.current_path = None
+        self._title_suffix = ""
         self._update_window_title()
 
     def _open_file(self) -> None:
@@ -344,30 +459,28 @@ class MainWindow(QtWidgets.QMainWindow):
 
         path = Path(path_str)
         try:
-            with path.open("r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = loads_json(path.read_bytes())
             plan = ShowPlan.from_dict(data)
         except Exception as exc:  # noqa: BLE001
             QtWidgets.QMessageBox.critical(self, "Error", f"Failed to open file:\n{exc}")
             return
 
-        # Map room names to their tabs
-        tab_by_name = {tab.room_name: tab for tab in self.room_tabs}
+        # Map room names to their cues (rooms missing from the file are cleared)
+        cues_by_name = {room_plan.name: room_plan.cues for room_plan in plan.rooms}
 
-        # First clear everything
-        for tab in self.room_tabs:
-            tab.set_cues([])
+        # Freeze painting while every room is reloaded, then repaint once
+        self.tab_widget.setUpdatesEnabled(False)
+        try:
+            for tab in self.room_tabs:
+                tab.set_cues(cues_by_name.get(tab.room_name, []))
 
-        # Then populate any matching rooms from the file
-        for room_plan in plan.rooms:
-            tab = tab_by_name.get(room_plan.name)
-            if tab is not None:
-                tab.set_cues(room_plan.cues)
-
-        if self.summary_tab is not None:
-            self.summary_tab.refresh_summary()
+            if self.summary_tab is not None:
+                self.summary_tab.refresh_summary()
+        finally:
+            self.tab_widget.setUpdatesEnabled(True)
 
         self.current_path = path
+        self._title_suffix = f" [{path.name}]"
         self._update_window_title()
 
     def _save_file(self) -> None:
@@ -396,46 +509,58 @@ class MainWindow(QtWidgets.QMainWindow):
 
         self._write_to_path(path)
         self.current_path = path
+        self._title_suffix = f" [{path.name}]"
         self._update_window_title()
 
     def _write_to_path(self, path: Path) -> None:
-        """Serialize current state (all rooms) to JSON and write to disk."""
-        rooms: list[RoomPlan] = []
-        for tab in self.room_tabs:
-            rooms.append(RoomPlan(name=tab.room_name, cues=tab.get_cues()))
-
-        plan = ShowPlan(rooms=rooms)
+        """
+        Serialize current state (all rooms) to JSON and write to disk.
 
+        Each tab supplies its own encoded room (cached until that room is
+        edited), and the rooms are written one at a time into the file.
+        """
         try:
-            with path.open("w", encoding="utf-8") as f:
-                json.dump(plan.to_dict(), f, indent=2)
+            with path.open("wb") as f:
+                f.write(b'{\n"rooms": [\n')
+                for index, tab in enumerate(self.room_tabs):
+                    if index:
+                        f.write(b",\n")
+                    f.write(tab.get_json_bytes())
+                f.write(b"\n]\n}\n")
         except Exception as exc:  # noqa: BLE001
             QtWidgets.QMessageBox.critical(self, "Error", f"Failed to save file:\n{exc}")
 
     def _update_window_title(self) -> None:
         """Update the window title to include the current file name, if any."""
-        base = "Ash's Cue Planner – Simple"
-        if self.current_path is None:
-            self.setWindowTitle(base)
-        else:
-            self.setWindowTitle(f"{base} [{self.current_path.name}]")
+        self.setWindowTitle(self._BASE_TITLE + self._title_suffix)
 
     # ------------------------------------------------------------------
     # Tab change handler
     # ------------------------------------------------------------------
     def _on_tab_changed(self, index: int) -> None:
         """
-        When switching to the Summary tab, refresh it so it always reflects
-        the latest room data.
+        Build a room's editor (or the Summary tab) the first time its tab is
+        shown, and refresh the Summary tab whenever it is selected so it
+        reflects the latest room data.
         """
-        widget = self.tab_widget.widget(index)
-        if self.summary_tab is not None and widget is self.summary_tab:
+        if index != self._summary_index:
+            self._ensure_room_tab(index)
+        elif self.summary_tab is None:
+            # A freshly built SummaryTab refreshes itself
+            self._ensure_summary_tab()
+        else:
+            self._summary_refresh_timer.start()
+
+    def _refresh_summary_now(self) -> None:
+        """Timer slot: refresh the summary once a burst of tab changes settles."""
+        if self.summary_tab is not None:
             self.summary_tab.refresh_summary()
 
 
 def main() -> None:
     app = QtWidgets.QApplication(sys.argv)
     app.setApplicationName("Ash's Cue Planner")
+    app.setStyleSheet(_MAIN_QSS)
 
     window = MainWindow()
     window.show()
@@ -9,15 +9,26 @@ Includes:
 - CueType, TriggerType, PlayType, StartMode enums
 - MediaCue dataclass (one cue)
 - RoomPlan / ShowPlan containers
-- JSON (de)serialization helpers
+- JSON (de)serialization helpers (orjson when available, stdlib json otherwise)
 - compute_schedule(...) to get effective cue start times
+- compute_lanes(...) to stack overlapping intervals into timeline lanes
+- RoomCuesMixin: a room's cue list plus its cached schedule and JSON
 """
 
 from __future__ import annotations
 
+import heapq
+import json
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
+
+# orjson is optional: it is several times faster than the stdlib for the
+# nested dict/list payloads we save, and works on bytes directly.
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
 
 
 class CueType(str, Enum):
@@ -69,7 +80,24 @@ class StartMode(str, Enum):
     AFTER_CUE = "After cue"
 
 
-@dataclass
+# value -> member tables for the hot from_dict path: one dict probe per
+# field instead of going through the Enum constructor.
+_CUE_TYPE_BY_VALUE: Dict[str, CueType] = {m.value: m for m in CueType}
+_TRIGGER_TYPE_BY_VALUE: Dict[str, TriggerType] = {m.value: m for m in TriggerType}
+_PLAY_TYPE_BY_VALUE: Dict[str, PlayType] = {m.value: m for m in PlayType}
+_START_MODE_BY_VALUE: Dict[str, StartMode] = {m.value: m for m in StartMode}
+
+
+def _enum_from_value(table: Dict[str, Any], enum_cls: type, value: Any) -> Any:
+    """Look up an enum member by value, falling back to the Enum constructor."""
+    member = table.get(value)
+    if member is None:
+        # Unknown value: let the Enum raise its usual ValueError
+        member = enum_cls(value)
+    return member
+
+
+@dataclass(slots=True)
 class MediaCue:
     """
     One cue in the room.
@@ -124,10 +152,22 @@ class MediaCue:
 
         return cls(
             name=data.get("name", ""),
-            cue_type=CueType(type_value),
-            trigger_type=TriggerType(data.get("trigger_type", TriggerType.TIMELINE.value)),
-            play_type=PlayType(data.get("play_type", PlayType.PLAY_ONCE.value)),
-            start_mode=StartMode(data.get("start_mode", StartMode.AT_TIME.value)),
+            cue_type=_enum_from_value(_CUE_TYPE_BY_VALUE, CueType, type_value),
+            trigger_type=_enum_from_value(
+                _TRIGGER_TYPE_BY_VALUE,
+                TriggerType,
+                data.get("trigger_type", TriggerType.TIMELINE.value),
+            ),
+            play_type=_enum_from_value(
+                _PLAY_TYPE_BY_VALUE,
+                PlayType,
+                data.get("play_type", PlayType.PLAY_ONCE.value),
+            ),
+            start_mode=_enum_from_value(
+                _START_MODE_BY_VALUE,
+                StartMode,
+                data.get("start_mode", StartMode.AT_TIME.value),
+            ),
             start_time_s=float(data.get("start_time_s", 0.0)),
             duration_s=float(data.get("duration_s", 0.0)),
             dependency_name=data.get("dependency_name") or None,
@@ -135,7 +175,7 @@ class MediaCue:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class RoomPlan:
     """Represents the plan for one room."""
     name: str
@@ -153,7 +193,7 @@ class RoomPlan:
         return cls(name=data.get("name", "Room"), cues=cues)
 
 
-@dataclass
+@dataclass(slots=True)
 class ShowPlan:
     """Root object representing the entire show (multiple rooms)."""
     rooms: List[RoomPlan] = field(default_factory=list)
@@ -167,6 +207,23 @@ class ShowPlan:
         return cls(rooms=rooms)
 
 
+# ----------------------------------------------------------------------
+# JSON encoding
+# ----------------------------------------------------------------------
+def dumps_json(data: Any) -> bytes:
+    """Encode data as indented UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def loads_json(raw: bytes) -> Any:
+    """Decode UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode("utf-8"))
+
+
 # ----------------------------------------------------------------------
 # Scheduling
 # ----------------------------------------------------------------------
@@ -187,40 +244,177 @@ def compute_schedule(cues: List[MediaCue]) -> List[float]:
     Returns:
         List of start times (same ordering as input list).
     """
-    start_times: List[float] = []
-    current_time = 0.0
+    # Common case: every cue sits at a fixed offset, so there are no
+    # dependencies to resolve.
+    at_time = StartMode.AT_TIME
+    if all(cue.start_mode is at_time for cue in cues):
+        return [max(cue.start_time_s, 0.0) for cue in cues]
+
+    # Length is known up front, so fill by index instead of appending
+    start_times: List[float] = [0.0] * len(cues)
+
+    # Enum members bound as locals so each comparison is a fast local load
+    after_previous = StartMode.AFTER_PREVIOUS
+    after_cue = StartMode.AFTER_CUE
+
+    # End time of the most recent cue seen with each name, so AFTER_CUE
+    # dependencies resolve with one lookup instead of a backwards scan.
+    ends_by_name: Dict[str, float] = {}
+
+    # End of the previous cue (0.0 before the first one)
+    prev_end = 0.0
 
     for index, cue in enumerate(cues):
-        if cue.start_mode == StartMode.AT_TIME:
+        start_mode = cue.start_mode
+        if start_mode == at_time:
             start = max(cue.start_time_s, 0.0)
-            current_time = max(current_time, start)
-
-        elif cue.start_mode == StartMode.AFTER_PREVIOUS:
-            if index == 0:
-                start = 0.0
-            else:
-                prev_start = start_times[index - 1]
-                prev_duration = max(cues[index - 1].duration_s, 0.0)
-                start = prev_start + prev_duration
-            current_time = start
-
-        elif cue.start_mode == StartMode.AFTER_CUE:
+
+        elif start_mode == after_previous:
+            start = prev_end
+
+        elif start_mode == after_cue:
             start = 0.0
             if cue.dependency_name:
-                # look for dependency among earlier cues
-                for dep_index in range(index - 1, -1, -1):
-                    if cues[dep_index].name == cue.dependency_name:
-                        dep_start = start_times[dep_index]
-                        dep_dur = max(cues[dep_index].duration_s, 0.0)
-                        start = dep_start + dep_dur
-                        break
-            current_time = max(current_time, start)
+                # only earlier cues are in the map at this point
+                dep_end = ends_by_name.get(cue.dependency_name)
+                if dep_end is not None:
+                    start = dep_end
 
         else:
             # Fallback: treat as AT_TIME = 0
             start = 0.0
-            current_time = max(current_time, start)
 
-        start_times.append(start)
+        start_times[index] = start
+        prev_end = start + max(cue.duration_s, 0.0)
+        ends_by_name[cue.name] = prev_end
 
     return start_times
+
+
+def compute_lanes(intervals: List[Tuple[float, float]]) -> Tuple[List[int], int]:
+    """
+    Assign each (start, end) interval to a "lane" so overlapping intervals
+    never share one.
+
+    Greedy interval-graph colouring:
+        - Sort by start time.
+        - Place each interval in the lowest-numbered lane that has
+          finished by its start; otherwise open a new lane.
+
+    Busy lanes are kept in a min-heap keyed on end time and finished lane
+    numbers in a second min-heap, so each step is O(log L) rather than a
+    scan over every lane.
+
+    Returns:
+        (lane index per interval in input order, number of lanes used).
+    """
+    n = len(intervals)
+    if n == 0:
+        return [], 0
+
+    # Bound __getitem__ keys avoid a Python-level lambda call per element
+    starts = [interval[0] for interval in intervals]
+    indices = sorted(range(n), key=starts.__getitem__)
+
+    busy: List[Tuple[float, int]] = []  # (end time, lane) for occupied lanes
+    free: List[int] = []                # lanes that have finished
+    num_lanes = 0
+    item_lane = [0] * n
+    # Local names for the heap functions: this loop is the hot path
+    heappush = heapq.heappush
+    heappop = heapq.heappop
+
+    for i in indices:
+        start, end = intervals[i]
+
+        # Starts only increase, so a lane that is free now stays free
+        while busy and busy[0][0] <= start:
+            heappush(free, heappop(busy)[1])
+
+        if free:
+            lane = heappop(free)
+        else:
+            lane = num_lanes
+            num_lanes += 1
+
+        heappush(busy, (end, lane))
+        item_lane[i] = lane
+
+    return item_lane, num_lanes
+
+
+# ----------------------------------------------------------------------
+# Room cue state
+# ----------------------------------------------------------------------
+class RoomCuesMixin:
+    """
+    Cue list of one room, with its schedule and JSON cached.
+
+    Shared by the room widgets (RoomTab and the placeholder that stands in
+    for it before it is opened), so both save, load and schedule the same
+    way. Classes using it set room_name, call _init_cues() in __init__ and
+    call _cues_changed() after editing self._cues in place.
+    """
+
+    room_name: str
+
+    def _init_cues(self) -> None:
+        self._cues: List[MediaCue] = []
+        # Bumped on every change to self._cues so derived data can be cached
+        self._cues_version: int = 0
+        self._schedule_cache: Tuple[int, List[float]] | None = None
+        self._json_cache: Tuple[int, bytes] | None = None
+
+    def _cues_changed(self) -> None:
+        """Invalidate the cached schedule and JSON after an in-place edit."""
+        self._cues_version += 1
+
+    def _replace_cues(self, cues: List[MediaCue]) -> bool:
+        """
+        Replace the cue list; return False when nothing changed.
+
+        A list equal to the current one (field by field, e.g. after a
+        save/open round trip) is a no-op, so cached data stays valid.
+        """
+        cues = list(cues)
+        if cues == self._cues:
+            return False
+        self._cues = cues
+        self._cues_changed()
+        return True
+
+    def get_cues(self) -> List[MediaCue]:
+        """Return a copy of the cues list."""
+        return list(self._cues)
+
+    def get_schedule(self) -> List[float]:
+        """
+        Return the effective start time of each cue (see compute_schedule).
+
+        The result is cached until the cue list changes; treat it as
+        read-only.
+        """
+        cache = self._schedule_cache
+        if cache is not None and cache[0] == self._cues_version:
+            return cache[1]
+        start_times = compute_schedule(self._cues)
+        self._schedule_cache = (self._cues_version, start_times)
+        return start_times
+
+    def to_json_obj(self) -> Dict[str, Any]:
+        """Return this room as a RoomPlan-shaped dict, without building a RoomPlan."""
+        return {"name": self.room_name, "cues": [c.to_dict() for c in self._cues]}
+
+    def get_json_bytes(self) -> bytes:
+        """
+        Return this room encoded as JSON (to_json_obj via dumps_json).
+
+        Cached until the cue list changes, so repeated saves skip rooms
+        that haven't been edited.
+        """
+        cache = self._json_cache
+        if cache is not None and cache[0] == self._cues_version:
+            return cache[1]
+        raw = dumps_json(self.to_json_obj())
+        self._json_cache = (self._cues_version, raw)
+        return raw
@@ -10,7 +10,8 @@ Layout:
     [ Cue Table ]
     [ Timeline Graph ]
 
-The timeline graph is a QGraphicsView (TimelineView) that draws:
+The timeline graph is a QGraphicsView (TimelineView) showing a
+TimelineScene, which draws:
     - Time axis in seconds.
     - Vertical grid lines.
     - One bar per cue, positioned according to its effective start time
@@ -32,7 +33,7 @@ Features:
 
 from __future__ import annotations
 
-from typing import List
+from typing import Dict, List, Tuple
 
 from PyQt5 import QtCore, QtGui, QtWidgets
 
@@ -42,10 +43,365 @@ from models import (
     PlayType,
     StartMode,
     MediaCue,
+    RoomCuesMixin,
+    compute_lanes,
     compute_schedule,
 )
 
 
+# Bar colour per cue type, as RGB so no Qt objects are built at import time
+_CUE_TYPE_COLORS: Dict[CueType, Tuple[int, int, int]] = {
+    CueType.AUDIO: (135, 206, 250),               # light blue
+    CueType.PROJECTION: (255, 228, 181),          # moccasin
+    CueType.TV: (152, 251, 152),                  # pale green
+    CueType.LIGHTING: (255, 182, 193),            # light pink
+    CueType.INTERACTIVE: (221, 160, 221),         # plum
+    CueType.ACTIVITY: (255, 215, 0),              # gold / yellow
+    CueType.GROUP_MOVEMENT: (64, 224, 208),       # teal
+    CueType.FACILITATOR_ACTION: (255, 165, 0),    # orange
+}
+_FALLBACK_CUE_COLOR = (211, 211, 211)             # fallback grey
+
+
+# ---------------------------------------------------------------------------
+# Cue bar items
+# ---------------------------------------------------------------------------
+
+class CueBarItem(QtWidgets.QGraphicsRectItem):
+    """
+    Cue bar that skips painting when none of it is exposed.
+
+    Paired with ItemUsesExtendedStyleOption so option.exposedRect is the
+    region Qt actually needs repainted, not the whole bounding rect.
+    """
+
+    def __init__(self, pen: QtGui.QPen, brush: QtGui.QBrush) -> None:
+        super().__init__()
+        self.setPen(pen)
+        self.setBrush(brush)
+        self.setFlag(QtWidgets.QGraphicsItem.ItemUsesExtendedStyleOption, True)
+
+    def paint(self, painter, option, widget=None) -> None:  # type: ignore[override]
+        if not option.exposedRect.intersects(self.rect()):
+            return
+        super().paint(painter, option, widget)
+
+
+class CueLabelItem(QtWidgets.QGraphicsSimpleTextItem):
+    """
+    Cue name drawn as a child of its CueBarItem.
+
+    The text is skipped while the parent bar is narrower than
+    MIN_BAR_PIXELS on screen, so zoomed-out views don't shape text that
+    would be unreadable anyway.
+    """
+
+    MIN_BAR_PIXELS = 20.0
+
+    def paint(self, painter, option, widget=None) -> None:  # type: ignore[override]
+        bar = self.parentItem()
+        if (
+            bar is not None
+            and painter.worldTransform().m11() * bar.rect().width() < self.MIN_BAR_PIXELS
+        ):
+            return
+        super().paint(painter, option, widget)
+
+
+# ---------------------------------------------------------------------------
+# Per-room timeline scene
+# ---------------------------------------------------------------------------
+
+class TimelineScene(QtWidgets.QGraphicsScene):
+    """
+    Scene holding one room's timeline: axis, grid, tick labels and one bar
+    per cue, with overlapping cues pushed onto separate "lanes".
+
+    The layout pass (lay_out) only needs the cues, their schedule and the
+    sizes given here, so the same code drives the on-screen TimelineView
+    and standalone scenes rendered for export.
+    """
+
+    # One shared brush per cue type, filled on first use (QBrush needs a
+    # QApplication, so this can't be built at import time).
+    _CUE_BRUSHES: Dict[CueType, QtGui.QBrush] = {}
+
+    def __init__(
+        self,
+        bar_height: float = 30.0,
+        lane_gap: float = 10.0,
+        parent: QtCore.QObject | None = None,
+    ) -> None:
+        super().__init__(parent)
+
+        # Dark background to match the global theme
+        self.setBackgroundBrush(QtGui.QColor(15, 24, 38))
+
+        # A room has at most a few hundred items, so the BSP index costs
+        # more to maintain than it saves.
+        self.setItemIndexMethod(QtWidgets.QGraphicsScene.NoIndex)
+
+        # Persistent items, updated in place by lay_out
+        self._axis_item: QtWidgets.QGraphicsLineItem | None = None
+        self._grid_items: List[QtWidgets.QGraphicsLineItem] = []
+        self._tick_label_items: List[QtWidgets.QGraphicsSimpleTextItem] = []
+        # Seconds between grid lines the tick labels currently read
+        self.tick_step: int = 5
+        # (max_end, axis_y, tick_step) the axis layer was last laid out for
+        self._last_axis: Tuple[float, float, int] | None = None
+        # id(cue) -> (cue, bar, label); the label is a child of the bar
+        self._cue_items: Dict[int, Tuple[MediaCue, CueBarItem, CueLabelItem]] = {}
+
+        # Geometry
+        self.pixels_per_second: float = 8.0
+        self.bar_height: float = bar_height
+        self.lane_gap: float = lane_gap
+        self.top_margin: float = 40.0
+        self.left_margin: float = 60.0
+
+        # Pens, fonts and colours shared by every layout pass
+        self._axis_pen = QtGui.QPen(QtGui.QColor(220, 230, 245))
+        self._grid_pen = QtGui.QPen(QtGui.QColor(90, 105, 135))
+        self._grid_pen.setStyle(QtCore.Qt.DashLine)
+        self._tick_font = QtGui.QFont("Segoe UI", 8)
+        self._text_color = QtGui.QColor(230, 235, 245)
+        self._bar_pen = QtGui.QPen(QtGui.QColor(10, 10, 10))
+        self._label_font_cue = QtGui.QFont("Segoe UI", 9)
+        self._label_brush = QtGui.QBrush(QtGui.QColor(10, 10, 10))
+
+    def tick_step_for_scale(self, scale: float) -> int:
+        """
+        Seconds between grid lines: a multiple of 5 keeping labels at least
+        ~60 device pixels apart at the given view scale.
+        """
+        seconds = 60.0 / (self.pixels_per_second * scale)
+        return max(5, int(seconds / 5) * 5)
+
+    def lay_out(
+        self,
+        cues: List[MediaCue],
+        start_times: List[float],
+        durations: List[float],
+        end_times: List[float],
+        tick_step: int,
+    ) -> float | None:
+        """
+        Bring the scene in line with cues and their schedule.
+
+        durations/end_times are the clamped durations and end times,
+        parallel to cues. Existing items are moved/resized in place rather
+        than rebuilt: see _rebuild_axis (axis, grid, tick labels) and
+        _sync_cues (bars).
+
+        Returns the time extent drawn (at least 10 s), or None when there
+        are no cues.
+        """
+        if not cues:
+            with QtCore.QSignalBlocker(self):
+                self._hide_axis()
+                self._sync_cues([], [], [], [])
+            return None
+
+        # Max time extent sizes the scene and axis; always show at least
+        # 10 seconds for some sense of scale.
+        max_end = max(max(end_times), 10.0)
+
+        cue_lanes, num_lanes = compute_lanes(list(zip(start_times, end_times)))
+
+        lane_pitch = self.bar_height + self.lane_gap
+        total_width = self.left_margin + max_end * self.pixels_per_second + 40.0
+        total_height = self.top_margin + num_lanes * lane_pitch + 80.0
+
+        self.setSceneRect(0, 0, total_width, total_height)
+
+        axis_y = self.top_margin + num_lanes * lane_pitch
+        # Item churn doesn't need to emit scene signals. setSceneRect stays
+        # outside the blocker: views track sceneRectChanged for their
+        # scrollbars.
+        with QtCore.QSignalBlocker(self):
+            self._rebuild_axis(max_end, axis_y, tick_step)
+            self._sync_cues(cues, start_times, durations, cue_lanes)
+        return max_end
+
+    def render_to_image(self, width: int, height: int) -> QtGui.QImage:
+        """Render the whole sceneRect into a new width x height QImage."""
+        image = QtGui.QImage(width, height, QtGui.QImage.Format_ARGB32)
+        image.fill(QtGui.QColor(15, 24, 38))  # match the dark background
+
+        painter = QtGui.QPainter(image)
+        target_rect = QtCore.QRectF(0, 0, width, height)
+
+        source_rect = self.sceneRect()
+        if source_rect.width() <= 0 or source_rect.height() <= 0:
+            # Fallback in case the scene hasn't been laid out yet
+            source_rect = QtCore.QRectF(0, 0, width, height)
+
+        self.render(painter, target=target_rect, source=source_rect)
+        painter.end()
+
+        return image
+
+    def _rebuild_axis(self, max_end: float, axis_y: float, tick_step: int) -> None:
+        """
+        Position the time axis plus a grid line and label every tick_step
+        seconds.
+
+        Grid/label items are pooled: new ones are only created when the
+        timeline grows past the pool, and surplus ones are hidden. The
+        whole pass is skipped when the extent, axis position and tick step
+        match the last layout, e.g. when only a cue inside the timeline
+        changed.
+        """
+        last = self._last_axis
+        if (
+            last is not None
+            and abs(max_end - last[0]) < 0.01
+            and axis_y == last[1]
+            and tick_step == last[2]
+        ):
+            return
+        self._last_axis = (max_end, axis_y, tick_step)
+
+        axis_end_x = self.left_margin + max_end * self.pixels_per_second
+        if self._axis_item is None:
+            self._axis_item = self.addLine(0.0, 0.0, 0.0, 0.0, self._axis_pen)
+            self._axis_item.setZValue(-1.0)
+        self._axis_item.setLine(self.left_margin, axis_y, axis_end_x, axis_y)
+        self._axis_item.setVisible(True)
+
+        num_ticks = int(max_end // tick_step) + 1
+        count = num_ticks + 1
+
+        # Tick i reads f"{i * tick_step}s", so existing labels only need new
+        # text when the step changes.
+        if tick_step != self.tick_step:
+            self.tick_step = tick_step
+            for i, text_item in enumerate(self._tick_label_items):
+                text_item.setText(f"{i * tick_step}s")
+
+        # Grow the pools if needed. Pooled items are added after the cue
+        # bars, so z=-1 keeps them underneath regardless of insertion order.
+        if len(self._grid_items) < count:
+            for i in range(len(self._grid_items), count):
+                line_item = self.addLine(0.0, 0.0, 0.0, 0.0, self._grid_pen)
+                line_item.setZValue(-1.0)
+                self._grid_items.append(line_item)
+                # Plain-text items: no QTextDocument layout per label
+                text_item = self.addSimpleText(f"{i * tick_step}s", self._tick_font)
+                text_item.setBrush(self._text_color)
+                text_item.setZValue(-1.0)
+                text_item.setCacheMode(QtWidgets.QGraphicsItem.DeviceCoordinateCache)
+                self._tick_label_items.append(text_item)
+
+        for i, (line_item, text_item) in enumerate(
+            zip(self._grid_items, self._tick_label_items)
+        ):
+            if i >= count:
+                line_item.setVisible(False)
+                text_item.setVisible(False)
+                continue
+            x = self.left_margin + i * tick_step * self.pixels_per_second
+            line_item.setLine(x, self.top_margin - 10.0, x, axis_y)
+            line_item.setVisible(True)
+            text_rect = text_item.boundingRect()
+            # 4 px gap plus the old QGraphicsTextItem's 4 px document margin
+            text_item.setPos(x - text_rect.width() / 2.0, axis_y + 8.0)
+            text_item.setVisible(True)
+
+    def _hide_axis(self) -> None:
+        """Hide the axis, grid and tick labels (used when there are no cues)."""
+        self._last_axis = None
+        if self._axis_item is not None:
+            self._axis_item.setVisible(False)
+        for item in self._grid_items:
+            item.setVisible(False)
+        for item in self._tick_label_items:
+            item.setVisible(False)
+
+    def _sync_cues(
+        self,
+        cues: List[MediaCue],
+        start_times: List[float],
+        durations: List[float],
+        cue_lanes: List[int],
+    ) -> None:
+        """
+        Create, move or remove cue bars so they match cues.
+
+        Items are keyed by id(cue). Each entry also holds the cue itself, so
+        an id can't be recycled by a new cue while its items still exist.
+        Cues are never edited in place, so a bar's colour and label are set
+        once when it is created. Bars are moved with setPos and keep their
+        rect at the item origin; the label is a child of the bar, so it
+        moves with it and is only positioned once.
+        """
+        left = self.left_margin
+        pps = self.pixels_per_second
+        top = self.top_margin
+        bar_height = self.bar_height
+        lane_pitch = bar_height + self.lane_gap
+
+        stale = dict(self._cue_items)
+        for cue, start, duration, lane_idx in zip(
+            cues, start_times, durations, cue_lanes
+        ):
+            bar_x = left + start * pps
+            bar_y = top + lane_idx * lane_pitch
+            bar_width = max(duration * pps, 20.0)
+
+            entry = stale.pop(id(cue), None)
+            if entry is None:
+                rect_item = CueBarItem(
+                    self._bar_pen, self._brush_for_cue_type(cue.cue_type)
+                )
+                # Cue label text (inside the bar if possible)
+                text_item = CueLabelItem(cue.name, rect_item)
+                text_item.setFont(self._label_font_cue)
+                text_item.setBrush(self._label_brush)
+                # 8 px in: the 4 px the label always had plus the 4 px
+                # document margin the old QGraphicsTextItem added. Centring
+                # on the bar needs no such offset (the margin was symmetric).
+                text_item.setPos(
+                    8.0, (bar_height - text_item.boundingRect().height()) / 2.0
+                )
+
+                # Cache bars and labels as device pixmaps so panning blits
+                # instead of repainting (Qt drops the cache on zoom).
+                rect_item.setCacheMode(QtWidgets.QGraphicsItem.DeviceCoordinateCache)
+                text_item.setCacheMode(QtWidgets.QGraphicsItem.DeviceCoordinateCache)
+                self.addItem(rect_item)
+                self._cue_items[id(cue)] = (cue, rect_item, text_item)
+            else:
+                _, rect_item, _ = entry
+
+            rect_item.setPos(bar_x, bar_y)
+            rect_item.setRect(0.0, 0.0, bar_width, bar_height)
+            rect_item.setToolTip(
+                f"{cue.name}\n"
+                f"{cue.cue_type.value} | {cue.trigger_type.value} | {cue.play_type.value}\n"
+                f"Start: {start:.1f}s  Duration: {cue.duration_s:.1f}s"
+            )
+
+        # Drop bars for cues that are gone (labels go with their bar)
+        for key, (_, rect_item, _) in stale.items():
+            self.removeItem(rect_item)
+            del self._cue_items[key]
+
+    @classmethod
+    def _brush_for_cue_type(cls, cue_type: CueType) -> QtGui.QBrush:
+        """Return the shared brush for a cue type, creating it on first use."""
+        brush = cls._CUE_BRUSHES.get(cue_type)
+        if brush is None:
+            brush = QtGui.QBrush(cls._color_for_cue_type(cue_type))
+            cls._CUE_BRUSHES[cue_type] = brush
+        return brush
+
+    @staticmethod
+    def _color_for_cue_type(cue_type: CueType) -> QtGui.QColor:
+        """Return a stable color associated with each cue type."""
+        return QtGui.QColor(*_CUE_TYPE_COLORS.get(cue_type, _FALLBACK_CUE_COLOR))
+
+
 # ---------------------------------------------------------------------------
 # Per-room timeline view
 # ---------------------------------------------------------------------------
@@ -54,7 +410,7 @@ class TimelineView(QtWidgets.QGraphicsView):
     """
     Timeline visualization for a list of MediaCue objects.
 
-    It draws:
+    It shows a TimelineScene:
         - Horizontal time axis.
         - Vertical grid lines.
         - One bar per cue, positioned according to its effective start time
@@ -67,23 +423,21 @@ class TimelineView(QtWidgets.QGraphicsView):
 
     def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
         super().__init__(parent)
-        self._scene = QtWidgets.QGraphicsScene(self)
+        self._scene = TimelineScene(parent=self)
         self.setScene(self._scene)
 
-        # Dark background to match the global theme
-        self._scene.setBackgroundBrush(QtGui.QColor(15, 24, 38))
-
         # List of cues and their computed start times.
         self._cues: List[MediaCue] = []
         self._start_times: List[float] = []
-
-        # Visual settings
-        self._pixels_per_second: float = 8.0
-        self._bar_height: float = 30.0
-        self._lane_gap: float = 10.0
-        self._top_margin: float = 40.0
-        self._left_margin: float = 60.0
-        self.setRenderHint(QtGui.QPainter.Antialiasing, True)
+        # Clamped durations and end times, parallel to self._cues
+        self._durations: List[float] = []
+        self._end_times: List[float] = []
+        # Signature of the cues last drawn; see set_cues
+        self._last_sig: tuple | None = None
+
+        # Everything drawn is axis-aligned lines and square-cornered bars, so
+        # antialiasing only adds fill cost (text keeps TextAntialiasing).
+        self.setRenderHint(QtGui.QPainter.Antialiasing, False)
         self.setMinimumHeight(220)
 
         # Interaction settings for zoom & pan
@@ -91,9 +445,34 @@ class TimelineView(QtWidgets.QGraphicsView):
         self.setTransformationAnchor(QtWidgets.QGraphicsView.AnchorUnderMouse)
         self.setResizeAnchor(QtWidgets.QGraphicsView.AnchorViewCenter)
 
+        # Rendering performance: skip painter state save/restore and
+        # antialias padding of exposed regions.
+        self.setViewportUpdateMode(QtWidgets.QGraphicsView.SmartViewportUpdate)
+        self.setOptimizationFlags(
+            QtWidgets.QGraphicsView.DontSavePainterState
+            | QtWidgets.QGraphicsView.DontAdjustForAntialiasing
+        )
+
         # Track whether the user has manually zoomed
         self._has_manual_zoom: bool = False
 
+        # Wheel notches are accumulated and applied as one scale() per
+        # ~frame, so fast spins and fine-grained trackpad deltas don't each
+        # trigger a viewport update.
+        self._zoom_accum: float = 0.0
+        self._zoom_timer = QtCore.QTimer(self)
+        self._zoom_timer.setSingleShot(True)
+        self._zoom_timer.setInterval(16)
+        self._zoom_timer.timeout.connect(self._apply_zoom)
+
+        # Redraws are coalesced: set_cues only schedules one, and a 0 ms
+        # single-shot timer runs it once control returns to the event loop.
+        self._redraw_pending: bool = False
+        self._redraw_timer = QtCore.QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.setInterval(0)
+        self._redraw_timer.timeout.connect(self._redraw)
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
@@ -105,10 +484,28 @@ class TimelineView(QtWidgets.QGraphicsView):
             - AT_TIME uses start_time_s
             - AFTER_PREVIOUS starts after the previous cue
             - AFTER_CUE starts after a named earlier cue
+
+        Calls with cues identical to the last ones (everything that affects
+        the schedule or what is drawn) return without doing any work.
         """
+        sig = tuple(
+            (c.name, c.cue_type, c.trigger_type, c.play_type, c.start_mode,
+             c.start_time_s, c.duration_s, c.dependency_name)
+            for c in cues
+        )
+        if sig == self._last_sig:
+            return
+        self._last_sig = sig
+
         self._cues = cues
         self._start_times = compute_schedule(cues)
-        self._redraw()
+        # Computed once per cue list; shared by the extent, lane and bar passes
+        self._durations = [max(cue.duration_s, 0.0) for cue in cues]
+        self._end_times = [
+            start + duration
+            for start, duration in zip(self._start_times, self._durations)
+        ]
+        self._schedule_redraw()
 
     def render_to_image(self, width: int = 2000, height: int = 400) -> QtGui.QImage:
         """
@@ -118,21 +515,34 @@ class TimelineView(QtWidgets.QGraphicsView):
         This ignores the user's current zoom level and always renders the full
         sceneRect into the requested width/height.
         """
-        image = QtGui.QImage(width, height, QtGui.QImage.Format_ARGB32)
-        image.fill(QtGui.QColor(15, 24, 38))  # match the dark background
-
-        painter = QtGui.QPainter(image)
-        target_rect = QtCore.QRectF(0, 0, width, height)
-
-        source_rect = self._scene.sceneRect()
-        if source_rect.width() <= 0 or source_rect.height() <= 0:
-            # Fallback in case the scene hasn't been laid out yet
-            source_rect = QtCore.QRectF(0, 0, width, height)
-
-        self._scene.render(painter, target=target_rect, source=source_rect)
-        painter.end()
+        self._flush_redraw()
+        return self._scene.render_to_image(width, height)
+
+    def render_to_image_with_sizes(
+        self,
+        width: int,
+        height: int,
+        bar_height: float,
+        lane_gap: float,
+    ) -> QtGui.QImage:
+        """
+        Render the current cues with different bar sizes into a QImage.
 
-        return image
+        The layout runs on a standalone TimelineScene, so this view's scene,
+        zoom and scroll position are never touched and no widget is built.
+        """
+        scene = TimelineScene(bar_height=bar_height, lane_gap=lane_gap)
+        scene.pixels_per_second = self._scene.pixels_per_second
+        scene.top_margin = self._scene.top_margin
+        scene.left_margin = self._scene.left_margin
+        scene.lay_out(
+            self._cues,
+            self._start_times,
+            self._durations,
+            self._end_times,
+            scene.tick_step_for_scale(1.0),
+        )
+        return scene.render_to_image(width, height)
 
     # ------------------------------------------------------------------
     # Zoom handling
@@ -142,7 +552,8 @@ class TimelineView(QtWidgets.QGraphicsView):
         Use mouse wheel to zoom in/out around the cursor.
 
         Default behaviour is scrolling; we override to zoom which feels
-        more natural for a timeline.
+        more natural for a timeline. Each 120-unit notch zooms by 1.2x;
+        see _apply_zoom.
         """
         # AngleDelta is in eighths of a degree; y > 0 means scroll up (zoom in)
         delta = event.angleDelta().y()
@@ -150,161 +561,64 @@ class TimelineView(QtWidgets.QGraphicsView):
             super().wheelEvent(event)
             return
 
-        zoom_factor = 1.2 if delta > 0 else 1 / 1.2
+        self._zoom_accum += delta / 120.0
+        if not self._zoom_timer.isActive():
+            self._zoom_timer.start()
+        event.accept()
+
+    def _apply_zoom(self) -> None:
+        """Apply the wheel notches accumulated since the last zoom tick."""
+        if not self._zoom_accum:
+            return
+        zoom_factor = 1.2 ** self._zoom_accum
+        self._zoom_accum = 0.0
         self._has_manual_zoom = True
         self.scale(zoom_factor, zoom_factor)
-        event.accept()
+        # Re-space the grid once the zoom calls for a different tick step
+        if self._cues and self._tick_step_for_zoom() != self._scene.tick_step:
+            self._schedule_redraw()
 
     # ------------------------------------------------------------------
     # Internal layout / drawing
     # ------------------------------------------------------------------
-    def _compute_lanes(self) -> List[int]:
-        """
-        Assign each cue to a "lane" (row) based on overlaps.
-
-        Greedy interval-graph colouring:
-            - Sort by start time.
-            - For each cue, place it in the first lane that has finished
-              before this cue starts; otherwise create a new lane.
-        Returns:
-            lane_index per cue (same ordering as self._cues).
-        """
-        n = len(self._cues)
-        if n == 0:
-            return []
-
-        indices = list(range(n))
-        indices.sort(key=lambda i: self._start_times[i])
-
-        lane_end_times: List[float] = []  # end time per lane
-        cue_lane = [0] * n
-
-        for i in indices:
-            start = self._start_times[i]
-            duration = max(self._cues[i].duration_s, 0.0)
-            end = start + duration
+    def _schedule_redraw(self) -> None:
+        """Request a redraw on the next event loop turn."""
+        self._redraw_pending = True
+        if not self._redraw_timer.isActive():
+            self._redraw_timer.start()
 
-            placed = False
-            for lane_idx, lane_end in enumerate(lane_end_times):
-                if start >= lane_end:
-                    cue_lane[i] = lane_idx
-                    lane_end_times[lane_idx] = end
-                    placed = True
-                    break
-
-            if not placed:
-                cue_lane[i] = len(lane_end_times)
-                lane_end_times.append(end)
-
-        return cue_lane
+    def _flush_redraw(self) -> None:
+        """Run a scheduled redraw now (used before rendering/exporting)."""
+        if self._redraw_pending:
+            self._redraw()
 
     def _redraw(self) -> None:
-        """Clear and redraw the entire timeline."""
-        self._scene.clear()
-        self._scene.setBackgroundBrush(QtGui.QColor(15, 24, 38))
-
-        if not self._cues:
-            return
-
-        # Compute max time extent to size the view and axis.
-        max_end = 0.0
-        for cue, start in zip(self._cues, self._start_times):
-            duration = max(cue.duration_s, 0.0)
-            end = start + duration
-            max_end = max(max_end, end)
-
-        # Always show at least 10 seconds for some sense of scale
-        max_end = max(max_end, 10.0)
-
-        cue_lanes = self._compute_lanes()
-        num_lanes = max(cue_lanes) + 1 if cue_lanes else 1
-
-        total_width = self._left_margin + max_end * self._pixels_per_second + 40.0
-        total_height = (
-            self._top_margin
-            + num_lanes * (self._bar_height + self._lane_gap)
-            + 80.0
+        """Bring the scene in line with the current cues (see TimelineScene.lay_out)."""
+        # A direct call satisfies any scheduled redraw
+        self._redraw_pending = False
+        self._redraw_timer.stop()
+
+        # Hold viewport repaints until every item is in place, then repaint
+        # once.
+        viewport = self.viewport()
+        viewport.setUpdatesEnabled(False)
+        try:
+            self._update_scene()
+        finally:
+            viewport.setUpdatesEnabled(True)
+        self._scene.update()
+
+    def _update_scene(self) -> None:
+        """Layout pass behind _redraw (runs with viewport updates held)."""
+        max_end = self._scene.lay_out(
+            self._cues,
+            self._start_times,
+            self._durations,
+            self._end_times,
+            self._tick_step_for_zoom(),
         )
-
-        self._scene.setSceneRect(0, 0, total_width, total_height)
-
-        # Colors used for axis/text
-        axis_color = QtGui.QColor(220, 230, 245)
-        grid_color = QtGui.QColor(90, 105, 135)
-        text_color = QtGui.QColor(230, 235, 245)
-
-        # Draw time axis
-        axis_y = self._top_margin + num_lanes * (self._bar_height + self._lane_gap)
-        axis_pen = QtGui.QPen(axis_color)
-        self._scene.addLine(
-            self._left_margin,
-            axis_y,
-            self._left_margin + max_end * self._pixels_per_second,
-            axis_y,
-            axis_pen,
-        )
-
-        # Draw grid and labels every 5 seconds.
-        grid_pen = QtGui.QPen(grid_color)
-        grid_pen.setStyle(QtCore.Qt.DashLine)
-        label_font = QtGui.QFont("Segoe UI", 8)
-
-        tick_step = 5
-        num_ticks = int(max_end // tick_step) + 1
-        for i in range(num_ticks + 1):
-            t = i * tick_step
-            x = self._left_margin + t * self._pixels_per_second
-
-            # Vertical grid line
-            self._scene.addLine(
-                x,
-                self._top_margin - 10.0,
-                x,
-                axis_y,
-                grid_pen,
-            )
-
-            # Time label
-            text_item = self._scene.addText(f"{t}s", label_font)
-            text_item.setDefaultTextColor(text_color)
-            text_rect = text_item.boundingRect()
-            text_item.setPos(x - text_rect.width() / 2.0, axis_y + 4.0)
-
-        # Draw cue bars
-        bar_pen = QtGui.QPen(QtGui.QColor(10, 10, 10))
-        label_font_cue = QtGui.QFont("Segoe UI", 9)
-
-        for idx, (cue, start) in enumerate(zip(self._cues, self._start_times)):
-            lane_idx = cue_lanes[idx]
-            color = self._color_for_cue_type(cue.cue_type)
-            brush = QtGui.QBrush(color)
-
-            bar_x = self._left_margin + start * self._pixels_per_second
-            bar_y = self._top_margin + lane_idx * (self._bar_height + self._lane_gap)
-            bar_width = max(cue.duration_s * self._pixels_per_second, 20.0)
-
-            rect_item = self._scene.addRect(
-                bar_x,
-                bar_y,
-                bar_width,
-                self._bar_height,
-                bar_pen,
-                brush,
-            )
-            rect_item.setToolTip(
-                f"{cue.name}\n"
-                f"{cue.cue_type.value} | {cue.trigger_type.value} | {cue.play_type.value}\n"
-                f"Start: {start:.1f}s  Duration: {cue.duration_s:.1f}s"
-            )
-
-            # Cue label text (inside the bar if possible)
-            label = f"{cue.name}"
-            text_item = self._scene.addText(label, label_font_cue)
-            text_item.setDefaultTextColor(QtGui.QColor(10, 10, 10))
-            text_rect = text_item.boundingRect()
-            text_x = bar_x + 4.0
-            text_y = bar_y + (self._bar_height - text_rect.height()) / 2.0
-            text_item.setPos(text_x, text_y)
+        if max_end is None:
+            return
 
         # Initial view / scaling behaviour:
         # - For relatively short timelines we auto-fit everything.
@@ -317,37 +631,105 @@ class TimelineView(QtWidgets.QGraphicsView):
             else:
                 # Show the start of the timeline by default
                 self.centerOn(
-                    self._left_margin,
+                    self._scene.left_margin,
                     self._scene.sceneRect().center().y(),
                 )
 
-    @staticmethod
-    def _color_for_cue_type(cue_type: CueType) -> QtGui.QColor:
-        """Return a stable color associated with each cue type."""
-        if cue_type == CueType.AUDIO:
-            return QtGui.QColor(135, 206, 250)  # light blue
-        if cue_type == CueType.PROJECTION:
-            return QtGui.QColor(255, 228, 181)  # moccasin
-        if cue_type == CueType.TV:
-            return QtGui.QColor(152, 251, 152)  # pale green
-        if cue_type == CueType.LIGHTING:
-            return QtGui.QColor(255, 182, 193)  # light pink
-        if cue_type == CueType.INTERACTIVE:
-            return QtGui.QColor(221, 160, 221)  # plum
-        if cue_type == CueType.ACTIVITY:
-            return QtGui.QColor(255, 215, 0)    # gold / yellow
-        if cue_type == CueType.GROUP_MOVEMENT:
-            return QtGui.QColor(64, 224, 208)   # teal
-        if cue_type == CueType.FACILITATOR_ACTION:
-            return QtGui.QColor(255, 165, 0)    # orange
-        return QtGui.QColor(211, 211, 211)      # fallback grey
+    def _tick_step_for_zoom(self) -> int:
+        """Grid spacing for the current zoom (see tick_step_for_scale)."""
+        scale = self.transform().m11() if self._has_manual_zoom else 1.0
+        return self._scene.tick_step_for_scale(scale)
+
+
+# ---------------------------------------------------------------------------
+# Cue table model
+# ---------------------------------------------------------------------------
+
+class CueTableModel(QtCore.QAbstractTableModel):
+    """
+    Read-only table model over a RoomTab's cue list.
+
+    The model holds a reference to the list itself rather than a copy of
+    its cells, so rows are rendered straight from the MediaCue objects.
+    All changes to the list go through append_cue / remove_cue / set_cues
+    so the view is told about them.
+    """
+
+    HEADERS = (
+        "Name",
+        "Cue Type",
+        "Trigger",
+        "Play type",
+        "Start mode",
+        "Depends on",
+        "Start time (s)",
+        "Duration (s)",
+        "Notes",
+    )
+
+    def __init__(self, cues: List[MediaCue], parent: QtCore.QObject | None = None) -> None:
+        super().__init__(parent)
+        self._cues = cues
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:  # type: ignore[override]
+        return 0 if parent.isValid() else len(self._cues)
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:  # type: ignore[override]
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.DisplayRole):  # type: ignore[override]
+        if role != QtCore.Qt.DisplayRole or not index.isValid():
+            return None
+        cue = self._cues[index.row()]
+        col = index.column()
+        if col == 0:
+            return cue.name
+        if col == 1:
+            return cue.cue_type.value
+        if col == 2:
+            return cue.trigger_type.value
+        if col == 3:
+            return cue.play_type.value
+        if col == 4:
+            return cue.start_mode.value
+        if col == 5:
+            return cue.dependency_name or ""
+        if col == 6:
+            return f"{cue.start_time_s:.1f}"
+        if col == 7:
+            return f"{cue.duration_s:.1f}"
+        return cue.notes
+
+    def headerData(self, section: int, orientation: QtCore.Qt.Orientation, role: int = QtCore.Qt.DisplayRole):  # type: ignore[override]
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def append_cue(self, cue: MediaCue) -> None:
+        """Append a cue to the list and add its row."""
+        row = len(self._cues)
+        self.beginInsertRows(QtCore.QModelIndex(), row, row)
+        self._cues.append(cue)
+        self.endInsertRows()
+
+    def remove_cue(self, row: int) -> None:
+        """Remove the cue at row from the list along with its row."""
+        self.beginRemoveRows(QtCore.QModelIndex(), row, row)
+        del self._cues[row]
+        self.endRemoveRows()
+
+    def set_cues(self, cues: List[MediaCue]) -> None:
+        """Point the model at a new cue list."""
+        self.beginResetModel()
+        self._cues = cues
+        self.endResetModel()
 
 
 # ---------------------------------------------------------------------------
 # RoomTab widget
 # ---------------------------------------------------------------------------
 
-class RoomTab(QtWidgets.QWidget):
+class RoomTab(QtWidgets.QWidget, RoomCuesMixin):
     """
     RoomTab encapsulates the UI and logic for editing cues in one room.
 
@@ -355,6 +737,9 @@ class RoomTab(QtWidgets.QWidget):
         - room_name: str
         - get_cues() -> List[MediaCue]
         - set_cues(cues: List[MediaCue]) -> None
+        - get_schedule() -> List[float]
+        - to_json_obj() -> dict
+        - get_json_bytes() -> bytes
         - export_timeline_image(width, height) -> QImage
     """
 
@@ -362,36 +747,44 @@ class RoomTab(QtWidgets.QWidget):
         """
         Export THIS room's timeline as an image for PDF export.
 
-        We temporarily increase bar height and lane gap so that in the PDF
-        the bars and labels are much more readable, then restore them for
-        normal GUI use.
-        """
-        tv = self.timeline_view
-
-        # Save old sizes
-        old_bar_height = tv._bar_height
-        old_lane_gap = tv._lane_gap
-
-        # Make everything chunkier for print
-        tv._bar_height = 40
-        tv._lane_gap = 16
-        tv._redraw()
+        Bars and lane gaps are drawn chunkier than in the GUI so that in the
+        PDF the bars and labels are much more readable. This happens on a
+        separate scene, so the on-screen timeline is left alone.
 
-        image = tv.render_to_image(width=width, height=height)
+        Images are cached per cue content and size, so exporting again
+        without edits skips both redraws and the rasterisation.
+        """
+        key = (
+            tuple(
+                (c.name, c.cue_type, c.duration_s, c.start_time_s,
+                 c.start_mode, c.dependency_name)
+                for c in self._cues
+            ),
+            width,
+            height,
+        )
+        cached = self._image_cache.get(key)
+        if cached is not None:
+            # Implicitly shared; detaches if the caller paints on it
+            return QtGui.QImage(cached)
 
-        # Restore GUI sizes
-        tv._bar_height = old_bar_height
-        tv._lane_gap = old_lane_gap
-        tv._redraw()
+        image = self.timeline_view.render_to_image_with_sizes(
+            width, height, bar_height=40, lane_gap=16
+        )
 
-        return image
+        self._image_cache[key] = image
+        return QtGui.QImage(image)
 
     def __init__(self, room_name: str, parent: QtWidgets.QWidget | None = None) -> None:
         super().__init__(parent)
         self.room_name = room_name
 
-        # Internal list of cues
-        self._cues: List[MediaCue] = []
+        # Internal list of cues, with cached schedule and JSON
+        self._init_cues()
+        # (cue fields, width, height) -> rendered export image
+        self._image_cache: Dict[tuple, QtGui.QImage] = {}
+        # Cue names the dependency dropdown currently lists
+        self._last_dep_names: Tuple[str, ...] = ()
 
         self._build_ui()
         self._connect_signals()
@@ -480,18 +873,9 @@ class RoomTab(QtWidgets.QWidget):
         main_layout.addWidget(form_group)
 
         # ---------- Table ----------
-        self.table = QtWidgets.QTableWidget(0, 9)
-        self.table.setHorizontalHeaderLabels([
-            "Name",
-            "Cue Type",
-            "Trigger",
-            "Play type",
-            "Start mode",
-            "Depends on",
-            "Start time (s)",
-            "Duration (s)",
-            "Notes",
-        ])
+        self._table_model = CueTableModel(self._cues, self)
+        self.table = QtWidgets.QTableView()
+        self.table.setModel(self._table_model)
         self.table.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
         self.table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
         self.table.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
@@ -561,19 +945,21 @@ class RoomTab(QtWidgets.QWidget):
             dependency_name=dependency_name,
             notes=notes,
         )
-        self._cues.append(cue)
+        self._table_model.append_cue(cue)
+        self._cues_changed()
+        self._image_cache.clear()
 
-        self._refresh_table()
         self._refresh_dependency_combo()
         self._refresh_timeline()
 
     def _on_remove_selected(self) -> None:
         """Remove the currently selected cue from the list."""
-        row = self.table.currentRow()
+        row = self.table.currentIndex().row()
         if row < 0 or row >= len(self._cues):
             return
-        del self._cues[row]
-        self._refresh_table()
+        self._table_model.remove_cue(row)
+        self._cues_changed()
+        self._image_cache.clear()
         self._refresh_dependency_combo()
         self._refresh_timeline()
 
@@ -596,26 +982,6 @@ class RoomTab(QtWidgets.QWidget):
         idx = self.start_mode_combo.currentIndex()
         return self.start_mode_combo.itemData(idx, QtCore.Qt.UserRole)
 
-    def _refresh_table(self) -> None:
-        """Rebuild the QTableWidget to reflect the internal cue list."""
-        self.table.setRowCount(len(self._cues))
-        for row, cue in enumerate(self._cues):
-            dep_text = cue.dependency_name or ""
-            data = [
-                cue.name,
-                cue.cue_type.value,
-                cue.trigger_type.value,
-                cue.play_type.value,
-                cue.start_mode.value,
-                dep_text,
-                f"{cue.start_time_s:.1f}",
-                f"{cue.duration_s:.1f}",
-                cue.notes,
-            ]
-            for col, value in enumerate(data):
-                item = QtWidgets.QTableWidgetItem(value)
-                self.table.setItem(row, col, item)
-
     def _refresh_timeline(self) -> None:
         """Redraw the timeline view with the current cues."""
         self.timeline_view.set_cues(self._cues)
@@ -624,29 +990,41 @@ class RoomTab(QtWidgets.QWidget):
         """
         Refresh the 'Depends on' dropdown to list all existing cues.
 
-        Only cues that already exist can be chosen as dependencies.
+        Only cues that already exist can be chosen as dependencies. Nothing
+        is rebuilt when the list of cue names hasn't changed.
         """
-        current_name = self.dependency_combo.currentText()
-        self.dependency_combo.blockSignals(True)
-        self.dependency_combo.clear()
-        self.dependency_combo.addItem("None", None)
-        for cue in self._cues:
-            self.dependency_combo.addItem(cue.name, cue.name)
-
-        # Try to restore previous selection if it still exists
-        idx = self.dependency_combo.findText(current_name)
-        if idx >= 0:
-            self.dependency_combo.setCurrentIndex(idx)
-        self.dependency_combo.blockSignals(False)
-
-    # Public API (for saving/loading)
-    def get_cues(self) -> List[MediaCue]:
-        """Return a copy of the cues list."""
-        return list(self._cues)
-
+        names = tuple(cue.name for cue in self._cues)
+        if names == self._last_dep_names:
+            return
+        self._last_dep_names = names
+
+        combo = self.dependency_combo
+        current_name = combo.currentData(QtCore.Qt.UserRole)
+        with QtCore.QSignalBlocker(combo):
+            combo.clear()
+            combo.addItem("None", None)
+            for name in names:
+                combo.addItem(name, name)
+
+            # Try to restore previous selection if it still exists
+            if current_name is not None:
+                idx = combo.findData(current_name, QtCore.Qt.UserRole)
+                if idx >= 0:
+                    combo.setCurrentIndex(idx)
+
+    # Public API (for saving/loading); get_cues, get_schedule, to_json_obj
+    # and get_json_bytes come from RoomCuesMixin
     def set_cues(self, cues: List[MediaCue]) -> None:
-        """Replace the cue list and refresh the UI."""
-        self._cues = list(cues)
-        self._refresh_table()
+        """
+        Replace the cue list and refresh the UI.
+
+        A list equal to the current one (field by field, e.g. after a
+        save/open round trip) is a no-op, so cached schedule, JSON and
+        export images stay valid.
+        """
+        if not self._replace_cues(cues):
+            return
+        self._image_cache.clear()
+        self._table_model.set_cues(self._cues)
         self._refresh_dependency_combo()
         self._refresh_timeline()
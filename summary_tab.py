@@ -12,18 +12,24 @@ SummaryTab aggregates all rooms and provides:
     * Full text report (stats + data dump)
 
 Relies on:
-    - models.MediaCue, CueType, TriggerType, PlayType, StartMode, compute_schedule
+    - models.MediaCue, CueType, TriggerType, PlayType, StartMode
     - RoomTab-like objects that expose:
         * room_name: str
         * get_cues() -> List[MediaCue]
+        * get_schedule() -> List[float]  (cached compute_schedule result)
         * export_timeline_image(width, height) -> QImage
 """
 
 from __future__ import annotations
 
+import functools
 import os
 import tempfile
+from collections import Counter, defaultdict
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
+from itertools import groupby
+from operator import add, attrgetter, itemgetter
 from typing import Any, Dict, List, Tuple
 
 from PyQt5 import QtCore, QtGui, QtWidgets
@@ -34,15 +40,136 @@ from models import (
     TriggerType,
     PlayType,
     StartMode,
-    compute_schedule,
+    compute_lanes,
 )
 
 
+# ---------------------------------------------------------------------------
+# reportlab (optional, only needed for PDF export)
+# ---------------------------------------------------------------------------
+
+# (A4, landscape, canvas) once imported, False if reportlab is missing,
+# None until the first attempt.
+_REPORTLAB: Tuple[Any, Any, Any] | bool | None = None
+
+
+def _load_reportlab() -> Tuple[Any, Any, Any] | None:
+    """
+    Import reportlab once and cache the pieces _export_pdf needs.
+
+    Returns None if reportlab isn't installed, so the app still runs
+    without it.
+    """
+    global _REPORTLAB
+    if _REPORTLAB is None:
+        try:
+            from reportlab.lib.pagesizes import A4, landscape
+            from reportlab.pdfgen import canvas
+        except Exception:  # noqa: BLE001
+            _REPORTLAB = False
+        else:
+            _REPORTLAB = (A4, landscape, canvas)
+    return _REPORTLAB or None
+
+
+class _ReportlabPreloader(QtCore.QRunnable):
+    """Pays reportlab's import cost off the UI thread."""
+
+    def run(self) -> None:  # type: ignore[override]
+        _load_reportlab()
+
+
+# PDF bar colours (normalized 0–1): the same palette as the timelines
+_PDF_CUE_COLORS: Dict[CueType, Tuple[float, float, float]] = {
+    CueType.AUDIO: (135 / 255.0, 206 / 255.0, 250 / 255.0),
+    CueType.PROJECTION: (255 / 255.0, 228 / 255.0, 181 / 255.0),
+    CueType.TV: (152 / 255.0, 251 / 255.0, 152 / 255.0),
+    CueType.LIGHTING: (255 / 255.0, 182 / 255.0, 193 / 255.0),
+    CueType.INTERACTIVE: (221 / 255.0, 160 / 255.0, 221 / 255.0),
+    CueType.ACTIVITY: (255 / 255.0, 215 / 255.0, 0 / 255.0),
+    CueType.GROUP_MOVEMENT: (64 / 255.0, 224 / 255.0, 208 / 255.0),
+    CueType.FACILITATOR_ACTION: (255 / 255.0, 165 / 255.0, 0 / 255.0),
+}
+_PDF_FALLBACK_COLOR = (211 / 255.0, 211 / 255.0, 211 / 255.0)
+
+
+# Report lines starting with one of these are styled as subheadings in the
+# PDF (str.startswith takes the whole tuple in one call)
+_REPORT_SUBHEADINGS: Tuple[str, ...] = (
+    "Cues by Cue Type",
+    "Cues by Trigger Type",
+    "Cues by Play Type",
+    "By Cue Type",
+    "By Trigger",
+    "By Play Type",
+    "Operator / design notes",
+    "Timeline for this room",
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_whole_seconds(s: int) -> str:
+    """
+    Format whole seconds as MM:SS or H:MM:SS (see SummaryTab._format_seconds).
+
+    Keyed on the rounded value, so the same tick labels and cue times
+    repeated across the report and PDF pages are formatted once.
+    """
+    h = s // 3600
+    m = (s % 3600) // 60
+    s2 = s % 60
+    if h > 0:
+        return f"{h:d}:{m:02d}:{s2:02d}"
+    return f"{m:02d}:{s2:02d}"
+
+
+@functools.lru_cache(maxsize=8)
+def _wrap_text(text: str, max_len: int = 110) -> Tuple[str, ...]:
+    """
+    Simple word-wrapping for the PDF text output.
+
+    Tries to preserve headings and indentation while wrapping long
+    body lines to a reasonable width. Cached, so exporting an unchanged
+    report again reuses the wrapped lines.
+    """
+    out_lines: List[str] = []
+    emit = out_lines.append
+    for raw_line in text.splitlines():
+        line = raw_line.rstrip()
+        stripped = line.strip()
+
+        # Short lines (headings or bullets) are kept as-is.
+        if len(stripped) <= max_len:
+            emit(line)
+            continue
+
+        # Wrap only long lines, preserving leading indentation
+        leading_spaces = len(line) - len(line.lstrip(" "))
+        indent = " " * leading_spaces
+        width = max_len - leading_spaces
+
+        current: List[str] = []
+        current_len = -1  # no separator before the first word
+        for w in stripped.split(" "):
+            lw = len(w)
+            current_len += lw + 1
+            if current_len > width and current:
+                emit(indent + " ".join(current))
+                current = [w]
+                current_len = lw
+            else:
+                current.append(w)
+        if current:
+            emit(indent + " ".join(current))
+
+    return tuple(out_lines)
+
+
 # ---------------------------------------------------------------------------
 # Global timeline data structure
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class GlobalTimelineItem:
     room_name: str
     cue: MediaCue
@@ -50,6 +177,164 @@ class GlobalTimelineItem:
     duration: float
 
 
+@dataclass
+class _TimelineLayout:
+    """Geometry of one global timeline render, in scene coordinates."""
+    max_end: float
+    width: float
+    height: float
+    axis_y: float
+    grid_xs: List[float]
+    tick_labels: List[Tuple[QtCore.QPointF, str]]
+    bars: List[Tuple[GlobalTimelineItem, QtCore.QRectF]]
+    cue_labels: List[Tuple[QtCore.QPointF, str]]
+
+
+# ---------------------------------------------------------------------------
+# Label overlay
+# ---------------------------------------------------------------------------
+
+class _LabelsOverlayItem(QtWidgets.QGraphicsItem):
+    """
+    Paints every text label of a scene from one item.
+
+    Labels are pre-laid-out QStaticText objects grouped by font and colour,
+    which avoids one QGraphicsTextItem (and its QTextDocument) per label.
+    In a scene only the labels overlapping the exposed rect are painted:
+    each group is sorted by x, so a bisect bounds the visible run the same
+    way _update_visible_bars windows the bars.
+    """
+
+    def __init__(self, bounds: QtCore.QRectF) -> None:
+        super().__init__()
+        self._bounds = QtCore.QRectF(bounds)
+        # (font, colour, [(top-left, text), ...] sorted by x, left edges,
+        #  widest label)
+        self._groups: List[
+            Tuple[
+                QtGui.QFont,
+                QtGui.QColor,
+                List[Tuple[QtCore.QPointF, QtGui.QStaticText]],
+                List[float],
+                float,
+            ]
+        ] = []
+        # Draw above the bars; exposedRect is only precise with this flag
+        self.setZValue(1.0)
+        self.setFlag(QtWidgets.QGraphicsItem.ItemUsesExtendedStyleOption, True)
+
+    def add_group(
+        self,
+        font: QtGui.QFont,
+        color: QtGui.QColor,
+        labels: List[Tuple[QtCore.QPointF, str]],
+    ) -> None:
+        """Add labels sharing one font and colour."""
+        label_xs = [pos.x() for pos, _ in labels]
+        order = sorted(range(len(labels)), key=label_xs.__getitem__)
+        static_labels = []
+        for i in order:
+            pos, text = labels[i]
+            static = QtGui.QStaticText(text)
+            static.setTextFormat(QtCore.Qt.PlainText)
+            static.prepare(QtGui.QTransform(), font)
+            static_labels.append((pos, static))
+        xs = [label_xs[i] for i in order]
+        max_width = max(
+            (static.size().width() for _, static in static_labels), default=0.0
+        )
+        self._groups.append((font, color, static_labels, xs, max_width))
+
+    def boundingRect(self) -> QtCore.QRectF:  # type: ignore[override]
+        return self._bounds
+
+    def paint(self, painter, option, widget=None) -> None:  # type: ignore[override]
+        exposed = option.exposedRect
+        for font, color, labels, xs, max_width in self._groups:
+            lo = bisect_left(xs, exposed.left() - max_width)
+            hi = bisect_right(xs, exposed.right())
+            if lo >= hi:
+                continue
+            painter.setFont(font)
+            painter.setPen(color)
+            for pos, static in labels[lo:hi]:
+                painter.drawStaticText(pos, static)
+
+    def paint_labels(self, painter: QtGui.QPainter) -> None:
+        """Draw every label group with painter (also used outside a scene)."""
+        for font, color, labels, _, _ in self._groups:
+            painter.setFont(font)
+            painter.setPen(color)
+            for pos, static in labels:
+                painter.drawStaticText(pos, static)
+
+
+class _AxisLayerItem(QtWidgets.QGraphicsItem):
+    """
+    Axis line, dashed grid and tick labels of the global timeline.
+
+    One item paints the whole static layer, and DeviceCoordinateCache keeps
+    it as a pixmap: panning blits it, and it is only repainted when the
+    zoom changes.
+    """
+
+    def __init__(
+        self,
+        layout: _TimelineLayout,
+        axis_line: QtCore.QLineF,
+        grid_top: float,
+        axis_pen: QtGui.QPen,
+        grid_pen: QtGui.QPen,
+        font: QtGui.QFont,
+        color: QtGui.QColor,
+    ) -> None:
+        super().__init__()
+        self._bounds = QtCore.QRectF(0, 0, layout.width, layout.height)
+        self._axis_line = axis_line
+        self._grid_lines = [
+            QtCore.QLineF(x, grid_top, x, layout.axis_y) for x in layout.grid_xs
+        ]
+        self._axis_pen = axis_pen
+        self._grid_pen = grid_pen
+        self._labels = _LabelsOverlayItem(self._bounds)
+        self._labels.add_group(font, color, layout.tick_labels)
+        self.setZValue(-1.0)
+        self.setCacheMode(QtWidgets.QGraphicsItem.DeviceCoordinateCache)
+
+    def boundingRect(self) -> QtCore.QRectF:  # type: ignore[override]
+        return self._bounds
+
+    def paint(self, painter, option, widget=None) -> None:  # type: ignore[override]
+        self.paint_axis(painter)
+
+    def paint_axis(self, painter: QtGui.QPainter) -> None:
+        """Draw the layer with painter (also used outside a scene)."""
+        painter.setPen(self._axis_pen)
+        painter.drawLine(self._axis_line)
+        painter.setPen(self._grid_pen)
+        painter.drawLines(self._grid_lines)
+        self._labels.paint_labels(painter)
+
+
+class _BarLayerItem(QtWidgets.QGraphicsItem):
+    """
+    Paintless parent of the global timeline's bar items.
+
+    Bars are created as its children instead of through scene.addRect, and
+    a rebuild drops every bar by removing this one item.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.setFlag(QtWidgets.QGraphicsItem.ItemHasNoContents, True)
+
+    def boundingRect(self) -> QtCore.QRectF:  # type: ignore[override]
+        return QtCore.QRectF()
+
+    def paint(self, painter, option, widget=None) -> None:  # type: ignore[override]
+        pass
+
+
 # ---------------------------------------------------------------------------
 # Global timeline view
 # ---------------------------------------------------------------------------
@@ -65,6 +350,22 @@ class GlobalTimelineView(QtWidgets.QGraphicsView):
     - Zoomable with mouse wheel, pannable with mouse drag.
     """
 
+    # Same palette as the room timeline (QColor is a plain value type, so
+    # it's safe to build at import time).
+    _CUE_COLORS: Dict[CueType, QtGui.QColor] = {
+        CueType.AUDIO: QtGui.QColor(135, 206, 250),               # light blue
+        CueType.PROJECTION: QtGui.QColor(255, 228, 181),          # moccasin
+        CueType.TV: QtGui.QColor(152, 251, 152),                  # pale green
+        CueType.LIGHTING: QtGui.QColor(255, 182, 193),            # light pink
+        CueType.INTERACTIVE: QtGui.QColor(221, 160, 221),         # plum
+        CueType.ACTIVITY: QtGui.QColor(255, 215, 0),              # gold / yellow
+        CueType.GROUP_MOVEMENT: QtGui.QColor(64, 224, 208),       # teal
+        CueType.FACILITATOR_ACTION: QtGui.QColor(255, 165, 0),    # orange
+    }
+    _FALLBACK_COLOR = QtGui.QColor(211, 211, 211)                 # fallback grey
+    # One shared brush per cue type, filled on first use
+    _CUE_BRUSHES: Dict[CueType, QtGui.QBrush] = {}
+
     def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
         super().__init__(parent)
         self._scene = QtWidgets.QGraphicsScene(self)
@@ -73,12 +374,47 @@ class GlobalTimelineView(QtWidgets.QGraphicsView):
         self._scene.setBackgroundBrush(QtGui.QColor(15, 24, 38))
 
         self._items: List[GlobalTimelineItem] = []
+        # Per-item start / clamped duration / end / lane, parallel to
+        # self._items and computed once in set_items
+        self._starts: List[float] = []
+        self._durations: List[float] = []
+        self._ends: List[float] = []
+        self._lanes: List[int] = []
+        self._num_lanes: int = 0
+
+        # Bars are windowed: only those overlapping the viewport are in the
+        # scene. _layout holds every bar's geometry; _order/_sorted_starts
+        # index it by start time and _max_bar_span (seconds) bounds how far
+        # left of the viewport a visible bar can start.
+        self._layout: _TimelineLayout | None = None
+        self._order: List[int] = []
+        self._sorted_starts: List[float] = []
+        self._max_bar_span: float = 0.0
+        self._bar_items: Dict[int, QtWidgets.QGraphicsRectItem] = {}
+        self._bar_layer: _BarLayerItem | None = None
+
+        # Static axis layer, kept across redraws while its geometry
+        # (max_end, axis_y, width, height) is unchanged; cue label overlay
+        self._axis_layer: _AxisLayerItem | None = None
+        self._axis_key: Tuple[float, float, float, float] | None = None
+        self._labels_overlay: _LabelsOverlayItem | None = None
 
         self._pixels_per_second: float = 6.0
         self._bar_height: float = 26.0
         self._lane_gap: float = 8.0
         self._top_margin: float = 40.0
         self._left_margin: float = 70.0
+
+        # Pens, fonts and colours shared by every redraw
+        self._axis_pen = QtGui.QPen(QtGui.QColor(220, 230, 245))
+        self._grid_pen = QtGui.QPen(QtGui.QColor(90, 105, 135))
+        self._grid_pen.setStyle(QtCore.Qt.DashLine)
+        self._text_color = QtGui.QColor(230, 235, 245)
+        self._label_font = QtGui.QFont("Segoe UI", 8)
+        self._bar_pen = QtGui.QPen(QtGui.QColor(10, 10, 10))
+        self._label_font_cue = QtGui.QFont("Segoe UI", 8)
+        self._label_color_cue = QtGui.QColor(10, 10, 10)
+
         self.setRenderHint(QtGui.QPainter.Antialiasing, True)
         self.setMinimumHeight(260)
 
@@ -88,12 +424,27 @@ class GlobalTimelineView(QtWidgets.QGraphicsView):
         self.setResizeAnchor(QtWidgets.QGraphicsView.AnchorViewCenter)
         self._has_manual_zoom: bool = False
 
+        # The scene is rebuilt wholesale on set_items and static in between,
+        # so a BSP index only costs time on every add. Many small items move
+        # together on zoom/pan, where one full repaint beats region tracking.
+        self._scene.setItemIndexMethod(QtWidgets.QGraphicsScene.NoIndex)
+        self.setViewportUpdateMode(QtWidgets.QGraphicsView.FullViewportUpdate)
+
+        # Bar tooltips are formatted on hover (see eventFilter)
+        self._scene.installEventFilter(self)
+
     # -----------------------
     # Public API
     # -----------------------
     def set_items(self, items: List[GlobalTimelineItem]) -> None:
         """Replace global timeline items and redraw."""
         self._items = items
+        self._starts = [item.start_time for item in items]
+        self._durations = [max(item.duration, 0.0) for item in items]
+        self._ends = [
+            start + duration for start, duration in zip(self._starts, self._durations)
+        ]
+        self._lanes, self._num_lanes = self._compute_lanes()
         self._redraw()
 
     def total_duration(self) -> float:
@@ -101,14 +452,7 @@ class GlobalTimelineView(QtWidgets.QGraphicsView):
         Return the total duration (end of last cue) in seconds,
         based on the global items list.
         """
-        if not self._items:
-            return 0.0
-        max_end = 0.0
-        for item in self._items:
-            end = item.start_time + max(item.duration, 0.0)
-            if end > max_end:
-                max_end = end
-        return max_end
+        return max(self._ends, default=0.0)
 
     def wheelEvent(self, event: QtGui.QWheelEvent) -> None:  # type: ignore[override]
         """Mouse wheel to zoom in/out around the cursor."""
@@ -120,221 +464,350 @@ class GlobalTimelineView(QtWidgets.QGraphicsView):
         zoom_factor = 1.2 if delta > 0 else 1 / 1.2
         self._has_manual_zoom = True
         self.scale(zoom_factor, zoom_factor)
+        self._update_visible_bars()
         event.accept()
 
-    def render_to_image(self, width: int = 2000, height: int = 600) -> QtGui.QImage:
+    def eventFilter(self, obj: QtCore.QObject, event: QtCore.QEvent) -> bool:  # type: ignore[override]
         """
-        Render the current scene into a QImage for PDF export.
+        Show a bar's tooltip when the scene asks for help at a position.
 
-        This uses the scene directly (not the view), so it ignores the
-        user's zoom level and always renders a full overview.
+        Bars only carry their item index (data key 0); the tooltip text is
+        built here, so nothing is formatted unless the user hovers.
         """
-        image = QtGui.QImage(width, height, QtGui.QImage.Format_ARGB32)
-        image.fill(QtGui.QColor(15, 24, 38))  # dark background
+        if obj is self._scene and event.type() == QtCore.QEvent.GraphicsSceneHelp:
+            for scene_item in self._scene.items(event.scenePos()):
+                idx = scene_item.data(0)
+                if idx is not None:
+                    QtWidgets.QToolTip.showText(
+                        event.screenPos(), self._tooltip_for(idx), self
+                    )
+                    break
+            else:
+                QtWidgets.QToolTip.hideText()
+            return True
+        return super().eventFilter(obj, event)
 
-        painter = QtGui.QPainter(image)
-        target_rect = QtCore.QRectF(0, 0, width, height)
-        source_rect = self._scene.sceneRect()
-        if source_rect.width() <= 0 or source_rect.height() <= 0:
-            source_rect = QtCore.QRectF(0, 0, width, height)
-        self._scene.render(painter, target=target_rect, source=source_rect)
-        painter.end()
+    def scrollContentsBy(self, dx: int, dy: int) -> None:  # type: ignore[override]
+        super().scrollContentsBy(dx, dy)
+        self._update_visible_bars()
 
-        return image
-    
+    def resizeEvent(self, event: QtGui.QResizeEvent) -> None:  # type: ignore[override]
+        super().resizeEvent(event)
+        self._update_visible_bars()
 
-    def export_for_pdf(self, width: int = 2500, height: int = 500) -> QtGui.QImage:
+    def render_to_image(self, width: int = 2000, height: int = 600) -> QtGui.QImage:
         """
-        Render a PDF-friendly version of the GLOBAL timeline.
+        Render the full timeline into a QImage for PDF export.
 
-        We temporarily increase bar height and lane gap so the global overview
-        is legible on A4, then restore the original values for normal GUI use.
+        This paints from the layout rather than the view (the scene only
+        holds the bars currently on screen), so it ignores the user's zoom
+        level and always renders a full overview.
         """
-        # Save old visual settings
-        old_bar_height = self._bar_height
-        old_lane_gap = self._lane_gap
-
-        # Make everything chunkier for print
-        self._bar_height = 40
-        self._lane_gap = 16
-        self._redraw()
-
-        image = self.render_to_image(width=width, height=height)
-
-        # Restore original settings
-        self._bar_height = old_bar_height
-        self._lane_gap = old_lane_gap
-        self._redraw()
+        layout = self._build_layout(self._bar_height, self._lane_gap)
+        return self._render_layout(layout, width, height)
 
-        return image
+    def export_for_pdf(self, width: int = 2500, height: int = 500) -> QtGui.QImage:
+        """
+        Render a PDF-friendly version of the GLOBAL timeline.
 
+        Bars and lane gaps are chunkier than in the GUI so the global
+        overview is legible on A4. This paints straight into the image from
+        a layout computed at print sizes; the on-screen scene isn't touched.
+        """
+        layout = self._build_layout(bar_height=40.0, lane_gap=16.0)
+        return self._render_layout(layout, width, height)
 
     # -----------------------
     # Internal layout/drawing
     # -----------------------
-    def _compute_lanes(self) -> List[int]:
+    def _compute_lanes(self) -> Tuple[List[int], int]:
         """
         Assign each item to a lane based on overlaps (greedy algorithm).
-        """
-        n = len(self._items)
-        if n == 0:
-            return []
-
-        indices = list(range(n))
-        indices.sort(key=lambda i: self._items[i].start_time)
-
-        lane_end_times: List[float] = []
-        item_lane = [0] * n
-
-        for i in indices:
-            start = self._items[i].start_time
-            duration = max(self._items[i].duration, 0.0)
-            end = start + duration
-
-            placed = False
-            for lane_idx, lane_end in enumerate(lane_end_times):
-                if start >= lane_end:
-                    item_lane[i] = lane_idx
-                    lane_end_times[lane_idx] = end
-                    placed = True
-                    break
-
-            if not placed:
-                item_lane[i] = len(lane_end_times)
-                lane_end_times.append(end)
 
-        return item_lane
+        See models.compute_lanes (lowest free lane first, heap based).
+        Returns the lane per item and the number of lanes.
+        """
+        return compute_lanes(list(zip(self._starts, self._ends)))
 
-    def _redraw(self) -> None:
-        self._scene.clear()
-        self._scene.setBackgroundBrush(QtGui.QColor(15, 24, 38))
+    def _build_layout(self, bar_height: float, lane_gap: float) -> _TimelineLayout | None:
+        """
+        Compute the geometry of the timeline for the given bar sizes.
 
+        Shared by the on-screen scene (_redraw) and the print render
+        (export_for_pdf). Returns None when there are no items.
+        """
         if not self._items:
-            return
-
-        max_end = 0.0
-        for item in self._items:
-            end = item.start_time + max(item.duration, 0.0)
-            max_end = max(max_end, end)
-        max_end = max(max_end, 10.0)
+            return None
 
-        item_lanes = self._compute_lanes()
-        num_lanes = max(item_lanes) + 1 if item_lanes else 1
+        max_end = max(max(self._ends), 10.0)
+        num_lanes = self._num_lanes
 
         total_width = self._left_margin + max_end * self._pixels_per_second + 60.0
         total_height = (
             self._top_margin
-            + num_lanes * (self._bar_height + self._lane_gap)
+            + num_lanes * (bar_height + lane_gap)
             + 100.0
         )
-        self._scene.setSceneRect(0, 0, total_width, total_height)
-
-        axis_color = QtGui.QColor(220, 230, 245)
-        grid_color = QtGui.QColor(90, 105, 135)
-        text_color = QtGui.QColor(230, 235, 245)
-
-        # Time axis
-        axis_y = self._top_margin + num_lanes * (self._bar_height + self._lane_gap)
-        axis_pen = QtGui.QPen(axis_color)
-        self._scene.addLine(
-            self._left_margin,
-            axis_y,
-            self._left_margin + max_end * self._pixels_per_second,
-            axis_y,
-            axis_pen,
-        )
+        axis_y = self._top_margin + num_lanes * (bar_height + lane_gap)
 
         # Grid + labels
-        grid_pen = QtGui.QPen(grid_color)
-        grid_pen.setStyle(QtCore.Qt.DashLine)
-        label_font = QtGui.QFont("Segoe UI", 8)
+        tick_metrics = QtGui.QFontMetricsF(self._label_font)
+        grid_xs: List[float] = []
+        tick_labels: List[Tuple[QtCore.QPointF, str]] = []
 
         tick_step = 10  # 10-second grid for global view
         num_ticks = int(max_end // tick_step) + 1
         for i in range(num_ticks + 1):
             t = i * tick_step
             x = self._left_margin + t * self._pixels_per_second
-            self._scene.addLine(
-                x,
-                self._top_margin - 10.0,
-                x,
-                axis_y,
-                grid_pen,
-            )
-            text_item = self._scene.addText(f"{t}s", label_font)
-            text_item.setDefaultTextColor(text_color)
-            text_rect = text_item.boundingRect()
-            text_item.setPos(x - text_rect.width() / 2.0, axis_y + 4.0)
+            grid_xs.append(x)
+            text = f"{t}s"
+            tick_labels.append((
+                QtCore.QPointF(x - tick_metrics.horizontalAdvance(text) / 2.0, axis_y + 8.0),
+                text,
+            ))
 
         # Bars
-        bar_pen = QtGui.QPen(QtGui.QColor(10, 10, 10))
-        label_font_cue = QtGui.QFont("Segoe UI", 8)
-
-        for idx, item in enumerate(self._items):
-            lane_idx = item_lanes[idx]
-            cue = item.cue
-            color = self._color_for_cue_type(cue.cue_type)
-            brush = QtGui.QBrush(color)
-
-            bar_x = self._left_margin + item.start_time * self._pixels_per_second
-            bar_y = self._top_margin + lane_idx * (self._bar_height + self._lane_gap)
-            bar_width = max(item.duration * self._pixels_per_second, 16.0)
-
-            rect_item = self._scene.addRect(
-                bar_x,
-                bar_y,
-                bar_width,
-                self._bar_height,
-                bar_pen,
-                brush,
+        cue_metrics = QtGui.QFontMetricsF(self._label_font_cue)
+        label_y_offset = (bar_height - cue_metrics.height()) / 2.0
+        bars: List[Tuple[GlobalTimelineItem, QtCore.QRectF]] = []
+        cue_labels: List[Tuple[QtCore.QPointF, str]] = []
+
+        left = self._left_margin
+        top = self._top_margin
+        pps = self._pixels_per_second
+        lane_pitch = bar_height + lane_gap
+        for item, start, duration, lane_idx in zip(
+            self._items, self._starts, self._durations, self._lanes
+        ):
+            bar_x = left + start * pps
+            bar_y = top + lane_idx * lane_pitch
+            bar_width = max(duration * pps, 16.0)
+            bars.append((item, QtCore.QRectF(bar_x, bar_y, bar_width, bar_height)))
+
+            # Keep the label inside its bar (7 px in from the left, as the
+            # old text items' document margin gave, 3 px on the right)
+            label = cue_metrics.elidedText(
+                f"{item.room_name}: {item.cue.name}", QtCore.Qt.ElideRight, bar_width - 10.0
             )
-            rect_item.setToolTip(
-                f"[{item.room_name}] {cue.name}\n"
-                f"{cue.cue_type.value} | {cue.trigger_type.value} | {cue.play_type.value}\n"
-                f"Start: {item.start_time:.1f}s  Duration: {item.duration:.1f}s"
+            if label:
+                cue_labels.append(
+                    (QtCore.QPointF(bar_x + 7.0, bar_y + label_y_offset), label)
+                )
+
+        return _TimelineLayout(
+            max_end=max_end,
+            width=total_width,
+            height=total_height,
+            axis_y=axis_y,
+            grid_xs=grid_xs,
+            tick_labels=tick_labels,
+            bars=bars,
+            cue_labels=cue_labels,
+        )
+
+    def _render_layout(
+        self, layout: _TimelineLayout | None, width: int, height: int
+    ) -> QtGui.QImage:
+        """Paint a whole layout into a new width x height image."""
+        image = QtGui.QImage(width, height, QtGui.QImage.Format_ARGB32)
+        image.fill(QtGui.QColor(15, 24, 38))  # dark background
+        if layout is None:
+            return image
+
+        painter = QtGui.QPainter(image)
+        # Fit the layout into the image keeping its aspect ratio, anchored
+        # top-left: the same mapping QGraphicsScene.render uses.
+        scale = min(width / layout.width, height / layout.height)
+        painter.scale(scale, scale)
+
+        self._axis_item(layout).paint_axis(painter)
+
+        # One brush change and one drawRects call per cue type
+        rects_by_type: Dict[CueType, List[QtCore.QRectF]] = defaultdict(list)
+        for item, rect in layout.bars:
+            rects_by_type[item.cue.cue_type].append(rect)
+        painter.setPen(self._bar_pen)
+        for cue_type, rects in rects_by_type.items():
+            painter.setBrush(self._brush_for_cue_type(cue_type))
+            painter.drawRects(rects)
+
+        self._labels_item(layout).paint_labels(painter)
+        painter.end()
+
+        return image
+
+    def _axis_item(self, layout: _TimelineLayout) -> _AxisLayerItem:
+        """Build the static axis / grid / tick label layer."""
+        axis_line = QtCore.QLineF(
+            self._left_margin,
+            layout.axis_y,
+            self._left_margin + layout.max_end * self._pixels_per_second,
+            layout.axis_y,
+        )
+        return _AxisLayerItem(
+            layout,
+            axis_line,
+            self._top_margin - 10.0,
+            self._axis_pen,
+            self._grid_pen,
+            self._label_font,
+            self._text_color,
+        )
+
+    def _labels_item(self, layout: _TimelineLayout) -> _LabelsOverlayItem:
+        """Build the overlay that paints every cue label."""
+        overlay = _LabelsOverlayItem(QtCore.QRectF(0, 0, layout.width, layout.height))
+        overlay.add_group(self._label_font_cue, self._label_color_cue, layout.cue_labels)
+        return overlay
+
+    def _redraw(self) -> None:
+        # Repaint once when the rebuild is done, not after every item change
+        self.setUpdatesEnabled(False)
+        try:
+            self._rebuild_scene()
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _rebuild_scene(self) -> None:
+        scene = self._scene
+        layout = self._build_layout(self._bar_height, self._lane_gap)
+        self._layout = layout
+        if layout is not None:
+            # Fix the scene rect up front so the view recomputes its
+            # scrollbars once, not as each item grows the bounding rect
+            scene.setSceneRect(0, 0, layout.width, layout.height)
+
+        blocked = scene.blockSignals(True)
+        try:
+            # Dropping the layer drops every bar with it
+            if self._bar_layer is not None:
+                scene.removeItem(self._bar_layer)
+                self._bar_layer = None
+            self._bar_items = {}
+            if self._labels_overlay is not None:
+                scene.removeItem(self._labels_overlay)
+                self._labels_overlay = None
+
+            if layout is None:
+                if self._axis_layer is not None:
+                    scene.removeItem(self._axis_layer)
+                    self._axis_layer = None
+                    self._axis_key = None
+                return
+
+            # Index bars by start time for _update_visible_bars
+            starts = self._starts
+            self._order = sorted(range(len(starts)), key=starts.__getitem__)
+            self._sorted_starts = [starts[i] for i in self._order]
+            self._max_bar_span = (
+                max(rect.width() for _, rect in layout.bars) / self._pixels_per_second
             )
 
-            label = f"{item.room_name}: {cue.name}"
-            text_item = self._scene.addText(label, label_font_cue)
-            text_item.setDefaultTextColor(QtGui.QColor(10, 10, 10))
-            text_rect = text_item.boundingRect()
-            text_x = bar_x + 3.0
-            text_y = bar_y + (self._bar_height - text_rect.height()) / 2.0
-            text_item.setPos(text_x, text_y)
+            # Time axis, grid and tick labels: rebuilt only if their geometry moved
+            axis_key = (layout.max_end, layout.axis_y, layout.width, layout.height)
+            if self._axis_layer is None or axis_key != self._axis_key:
+                if self._axis_layer is not None:
+                    scene.removeItem(self._axis_layer)
+                self._axis_layer = self._axis_item(layout)
+                self._axis_key = axis_key
+                scene.addItem(self._axis_layer)
+
+            # All cue labels are painted by one overlay item
+            self._labels_overlay = self._labels_item(layout)
+            scene.addItem(self._labels_overlay)
+
+            # Parent of the bars _update_visible_bars creates
+            self._bar_layer = _BarLayerItem()
+            scene.addItem(self._bar_layer)
+        finally:
+            scene.blockSignals(blocked)
 
         # Same scaling strategy as the room timeline:
         # - Short global timelines: auto-fit.
         # - Long ones: keep text legible and use scrollbars.
         if not self._has_manual_zoom:
             self.resetTransform()
-            if max_end <= 150.0:
-                self.fitInView(self._scene.sceneRect(), QtCore.Qt.KeepAspectRatio)
+            if layout.max_end <= 150.0:
+                self.fitInView(scene.sceneRect(), QtCore.Qt.KeepAspectRatio)
             else:
                 self.centerOn(
                     self._left_margin,
-                    self._scene.sceneRect().center().y(),
+                    scene.sceneRect().center().y(),
                 )
 
-    @staticmethod
-    def _color_for_cue_type(cue_type: CueType) -> QtGui.QColor:
+        # Bars
+        self._update_visible_bars()
+
+    def _update_visible_bars(self) -> None:
+        """
+        Add bar items that have scrolled into view and drop those that left.
+
+        Candidates come from a bisect over start times: a bar can only be
+        visible if it starts before the right edge and no more than
+        _max_bar_span before the left edge.
+        """
+        layout = self._layout
+        if layout is None:
+            return
+
+        visible = self.mapToScene(self.viewport().rect()).boundingRect()
+        left = self._left_margin
+        pps = self._pixels_per_second
+        t_left = (visible.left() - left) / pps
+        t_right = (visible.right() - left) / pps
+        lo = bisect_left(self._sorted_starts, t_left - self._max_bar_span)
+        hi = bisect_right(self._sorted_starts, t_right)
+
+        bars = layout.bars
+        visible_left = visible.left()
+        wanted = {
+            idx for idx in self._order[lo:hi]
+            if bars[idx][1].right() >= visible_left
+        }
+
+        scene = self._scene
+        bar_items = self._bar_items
+        blocked = scene.blockSignals(True)
+        try:
+            for idx in [idx for idx in bar_items if idx not in wanted]:
+                scene.removeItem(bar_items.pop(idx))
+
+            bar_pen = self._bar_pen
+            bar_layer = self._bar_layer
+            for idx in wanted.difference(bar_items):
+                item, rect = bars[idx]
+                rect_item = QtWidgets.QGraphicsRectItem(rect, bar_layer)
+                rect_item.setPen(bar_pen)
+                rect_item.setBrush(self._brush_for_cue_type(item.cue.cue_type))
+                rect_item.setData(0, idx)
+                bar_items[idx] = rect_item
+        finally:
+            scene.blockSignals(blocked)
+
+    def _tooltip_for(self, idx: int) -> str:
+        """Tooltip text for the bar of self._items[idx]."""
+        item = self._items[idx]
+        cue = item.cue
+        return (
+            f"[{item.room_name}] {cue.name}\n"
+            f"{cue.cue_type.value} | {cue.trigger_type.value} | {cue.play_type.value}\n"
+            f"Start: {item.start_time:.1f}s  Duration: {item.duration:.1f}s"
+        )
+
+    @classmethod
+    def _color_for_cue_type(cls, cue_type: CueType) -> QtGui.QColor:
         """Mirror the colours from the RoomTab timeline."""
-        if cue_type == CueType.AUDIO:
-            return QtGui.QColor(135, 206, 250)  # light blue
-        if cue_type == CueType.PROJECTION:
-            return QtGui.QColor(255, 228, 181)  # moccasin
-        if cue_type == CueType.TV:
-            return QtGui.QColor(152, 251, 152)  # pale green
-        if cue_type == CueType.LIGHTING:
-            return QtGui.QColor(255, 182, 193)  # light pink
-        if cue_type == CueType.INTERACTIVE:
-            return QtGui.QColor(221, 160, 221)  # plum
-        if cue_type == CueType.ACTIVITY:
-            return QtGui.QColor(255, 215, 0)    # gold / yellow
-        if cue_type == CueType.GROUP_MOVEMENT:
-            return QtGui.QColor(64, 224, 208)   # teal
-        if cue_type == CueType.FACILITATOR_ACTION:
-            return QtGui.QColor(255, 165, 0)    # orange
-        return QtGui.QColor(211, 211, 211)      # fallback grey
+        return cls._CUE_COLORS.get(cue_type, cls._FALLBACK_COLOR)
+
+    @classmethod
+    def _brush_for_cue_type(cls, cue_type: CueType) -> QtGui.QBrush:
+        """Return the shared brush for a cue type, creating it on first use."""
+        brush = cls._CUE_BRUSHES.get(cue_type)
+        if brush is None:
+            brush = QtGui.QBrush(cls._color_for_cue_type(cue_type))
+            cls._CUE_BRUSHES[cue_type] = brush
+        return brush
 
 
 # ---------------------------------------------------------------------------
@@ -356,13 +829,24 @@ class SummaryTab(QtWidgets.QWidget):
         room_tabs: list of RoomTab-like objects exposing:
             - room_name: str
             - get_cues() -> List[MediaCue]
+            - get_schedule() -> List[float]
         """
         super().__init__(parent)
         self._room_tabs = room_tabs
 
+        # (room_name, cues) per tab as of the last refresh, and the stats
+        # computed from them; see refresh_summary.
+        self._summary_inputs: List[Tuple[str, List[MediaCue]]] | None = None
+        self._stats: Tuple[
+            List[GlobalTimelineItem], Dict[str, Dict[str, Any]], Dict[str, Any]
+        ] | None = None
+
         self._build_ui()
         self.refresh_summary()
 
+        # Import reportlab in the background so the first export is instant
+        QtCore.QThreadPool.globalInstance().start(_ReportlabPreloader())
+
     # -----------------------
     # UI
     # -----------------------
@@ -388,8 +872,10 @@ class SummaryTab(QtWidgets.QWidget):
         # Text report
         self.summary_edit = QtWidgets.QTextEdit()
         self.summary_edit.setReadOnly(True)
-        font = QtGui.QFont("Consolas", 9)
-        self.summary_edit.setFont(font)
+        self._mono_font = QtGui.QFont("Consolas", 9)
+        self.summary_edit.setFont(self._mono_font)
+        # Long report lines scroll instead of re-wrapping on every resize
+        self.summary_edit.setLineWrapMode(QtWidgets.QTextEdit.NoWrap)
 
         summary_group = QtWidgets.QGroupBox("Detailed Report")
         sg_layout = QtWidgets.QVBoxLayout(summary_group)
@@ -410,11 +896,34 @@ class SummaryTab(QtWidgets.QWidget):
         - Build global timeline items.
         - Compute per-room + global statistics.
         - Update timeline view + text report.
+
+        Nothing is recomputed or redrawn if every room still has the same
+        cues as at the last refresh.
         """
-        global_items, room_stats, global_stats = self._compute_all_stats()
+        inputs = [(tab.room_name, tab.get_cues()) for tab in self._room_tabs]
+        if inputs == self._summary_inputs:
+            return
+        self._summary_inputs = inputs
+
+        self._stats = self._compute_all_stats()
+        global_items, room_stats, global_stats = self._stats
         self.timeline_view.set_items(global_items)
         report_text = self._build_report_text(global_items, room_stats, global_stats)
-        self.summary_edit.setPlainText(report_text)
+
+        # Fill a fresh document off-screen and swap it in, rather than
+        # having the edit diff and re-lay out its current one.
+        doc = QtGui.QTextDocument(self.summary_edit)
+        doc.setUndoRedoEnabled(False)
+        doc.setDefaultFont(self._mono_font)
+        doc.setPlainText(report_text)
+        # The edit deletes its built-in default document itself in
+        # setDocument; only documents created here are ours to delete, and
+        # that must be decided before the swap (the default one is gone after).
+        old_doc = self.summary_edit.document()
+        owned = old_doc.parent() is self.summary_edit
+        self.summary_edit.setDocument(doc)
+        if owned:
+            old_doc.deleteLater()
 
     # ---- stats & analysis ----
     def _compute_all_stats(
@@ -432,14 +941,14 @@ class SummaryTab(QtWidgets.QWidget):
         # For global stats
         total_cues = 0
         total_duration = 0.0
-        cue_type_counts: Dict[CueType, int] = {}
-        trigger_counts: Dict[TriggerType, int] = {}
-        play_counts: Dict[PlayType, int] = {}
+        cue_type_counts: Counter[CueType] = Counter()
+        trigger_counts: Counter[TriggerType] = Counter()
+        play_counts: Counter[PlayType] = Counter()
 
         global_offset = 0.0  # accumulates room durations
 
         for tab in self._room_tabs:
-            room_name = getattr(tab, "room_name", "Room")
+            room_name = tab.room_name
             cues = tab.get_cues()
             if not cues:
                 # Still record empty stats
@@ -454,70 +963,62 @@ class SummaryTab(QtWidgets.QWidget):
                 }
                 continue
 
-            # Local schedule for room
-            starts = compute_schedule(cues)
-            room_end = 0.0
-
-            by_cue_type: Dict[CueType, Dict[str, Any]] = {}
-            by_trigger: Dict[TriggerType, Dict[str, Any]] = {}
-            by_play: Dict[PlayType, Dict[str, Any]] = {}
-            notes_list: List[Tuple[float, str, str]] = []  # (start, cue_name, note)
-            timeline_entries: List[Tuple[float, MediaCue]] = []
-
-            for cue, local_start in zip(cues, starts):
-                duration = max(cue.duration_s, 0.0)
-                end = local_start + duration
-                room_end = max(room_end, end)
-
-                # Global item
-                global_items.append(
-                    GlobalTimelineItem(
-                        room_name=room_name,
-                        cue=cue,
-                        start_time=global_offset + local_start,
-                        duration=duration,
-                    )
+            # Local schedule for room (cached by the tab until its cues change)
+            starts = tab.get_schedule()
+            durations = [max(cue.duration_s, 0.0) for cue in cues]
+            room_end = max(map(add, starts, durations), default=0.0)
+
+            global_items.extend([
+                GlobalTimelineItem(
+                    room_name=room_name,
+                    cue=cue,
+                    start_time=global_offset + local_start,
+                    duration=duration,
                 )
-
-                # Per-room stats
-                timeline_entries.append((local_start, cue))
-
-                ct = cue.cue_type
-                tt = cue.trigger_type
-                pt = cue.play_type
-
-                # Cue type stats
-                ct_entry = by_cue_type.setdefault(ct, {"count": 0, "total_duration": 0.0})
+                for cue, local_start, duration in zip(cues, starts, durations)
+            ])
+
+            # Per-room stats
+            timeline_entries: List[Tuple[float, MediaCue]] = list(zip(starts, cues))
+            notes_list: List[Tuple[float, str, str]] = [  # (start, cue_name, note)
+                (local_start, cue.name, cue.notes)
+                for cue, local_start in zip(cues, starts)
+                if cue.notes
+            ]
+
+            by_cue_type: defaultdict[CueType, Dict[str, Any]] = defaultdict(
+                lambda: {"count": 0, "total_duration": 0.0}
+            )
+            for cue, duration in zip(cues, durations):
+                ct_entry = by_cue_type[cue.cue_type]
                 ct_entry["count"] += 1
                 ct_entry["total_duration"] += duration
 
-                # Trigger stats
-                tt_entry = by_trigger.setdefault(tt, {"count": 0})
-                tt_entry["count"] += 1
-
-                # Play stats
-                pt_entry = by_play.setdefault(pt, {"count": 0})
-                pt_entry["count"] += 1
-
-                # Notes
-                if cue.notes:
-                    notes_list.append((local_start, cue.name, cue.notes))
+            room_trigger_counts = Counter(cue.trigger_type for cue in cues)
+            room_play_counts = Counter(cue.play_type for cue in cues)
+            by_trigger: Dict[TriggerType, Dict[str, Any]] = {
+                tt: {"count": count} for tt, count in room_trigger_counts.items()
+            }
+            by_play: Dict[PlayType, Dict[str, Any]] = {
+                pt: {"count": count} for pt, count in room_play_counts.items()
+            }
 
-                # Global stats
-                total_cues += 1
-                total_duration += duration
-                cue_type_counts[ct] = cue_type_counts.get(ct, 0) + 1
-                trigger_counts[tt] = trigger_counts.get(tt, 0) + 1
-                play_counts[pt] = play_counts.get(pt, 0) + 1
+            # Global stats
+            total_cues += len(cues)
+            total_duration += sum(durations)
+            for ct, ct_entry in by_cue_type.items():
+                cue_type_counts[ct] += ct_entry["count"]
+            trigger_counts.update(room_trigger_counts)
+            play_counts.update(room_play_counts)
 
             room_stats[room_name] = {
                 "num_cues": len(cues),
                 "room_duration": room_end,
-                "by_cue_type": by_cue_type,
+                "by_cue_type": dict(by_cue_type),
                 "by_trigger": by_trigger,
                 "by_play": by_play,
-                "notes": sorted(notes_list, key=lambda x: x[0]),
-                "timeline": sorted(timeline_entries, key=lambda x: x[0]),
+                "notes": sorted(notes_list, key=itemgetter(0)),
+                "timeline": sorted(timeline_entries, key=itemgetter(0)),
             }
 
             global_offset += room_end
@@ -546,36 +1047,34 @@ class SummaryTab(QtWidgets.QWidget):
         - Per-room breakdown in plain English
         - Global, room-to-room timeline in plain English
         """
-        lines: List[str] = []
-
-        # Overall header
-        lines.append("ASH'S CUE PLANNER – FULL SUMMARY")
-        lines.append("=" * 72)
-        lines.append("")
+        fmt = self._format_seconds
 
         # Global overview
         total_cues = global_stats["total_cues"]
         total_duration = global_stats["total_duration"]
         total_show = global_stats["total_show_duration"]
-        lines.append("OVERALL SHOW")
-        lines.append("-" * 72)
-        lines.append(f"Total number of rooms: {len(room_stats)}")
-        lines.append(f"Total number of cues:  {total_cues}")
-        lines.append(
+
+        # Overall header
+        lines: List[str] = [
+            "ASH'S CUE PLANNER – FULL SUMMARY",
+            "=" * 72,
+            "",
+            "OVERALL SHOW",
+            "-" * 72,
+            f"Total number of rooms: {len(room_stats)}",
+            f"Total number of cues:  {total_cues}",
             f"Total cue time (all rooms combined): {total_duration:.1f} s "
-            f"({self._format_seconds(total_duration)})"
-        )
-        lines.append(
+            f"({fmt(total_duration)})",
             f"End of the final room relative to the start of Reception: "
-            f"{total_show:.1f} s ({self._format_seconds(total_show)})"
-        )
-        lines.append("")
+            f"{total_show:.1f} s ({fmt(total_show)})",
+            "",
+        ]
 
         # By cue type
         lines.append("Cues by Cue Type (whole show):")
         cue_type_counts: Dict[CueType, int] = global_stats["cue_type_counts"]
         if cue_type_counts:
-            for ct in sorted(cue_type_counts.keys(), key=lambda x: x.value):
+            for ct in sorted(cue_type_counts.keys(), key=attrgetter("value")):
                 lines.append(f"  • {ct.value}: {cue_type_counts[ct]} cues")
         else:
             lines.append("  (no cues defined yet)")
@@ -585,7 +1084,7 @@ class SummaryTab(QtWidgets.QWidget):
         lines.append("Cues by Trigger Type (whole show):")
         trig_counts: Dict[TriggerType, int] = global_stats["trigger_counts"]
         if trig_counts:
-            for tt in sorted(trig_counts.keys(), key=lambda x: x.value):
+            for tt in sorted(trig_counts.keys(), key=attrgetter("value")):
                 lines.append(f"  • {tt.value}: {trig_counts[tt]} cues")
         else:
             lines.append("  (no cues defined yet)")
@@ -595,7 +1094,7 @@ class SummaryTab(QtWidgets.QWidget):
         lines.append("Cues by Play Type (whole show):")
         play_counts: Dict[PlayType, int] = global_stats["play_counts"]
         if play_counts:
-            for pt in sorted(play_counts.keys(), key=lambda x: x.value):
+            for pt in sorted(play_counts.keys(), key=attrgetter("value")):
                 lines.append(f"  • {pt.value}: {play_counts[pt]} cues")
         else:
             lines.append("  (no cues defined yet)")
@@ -603,27 +1102,25 @@ class SummaryTab(QtWidgets.QWidget):
         lines.append("")
 
         # Per-room breakdown
-        lines.append("PER-ROOM BREAKDOWN")
-        lines.append("=" * 72)
-        lines.append("")
+        lines.extend(("PER-ROOM BREAKDOWN", "=" * 72, ""))
 
         for room_name, stats in room_stats.items():
-            lines.append(f"ROOM: {room_name}")
-            lines.append("-" * 72)
             num_cues = stats["num_cues"]
             room_dur = stats["room_duration"]
-            lines.append(f"Number of cues in this room: {num_cues}")
-            lines.append(
+            lines.extend((
+                f"ROOM: {room_name}",
+                "-" * 72,
+                f"Number of cues in this room: {num_cues}",
                 f"Approximate duration of this room: {room_dur:.1f} s "
-                f"({self._format_seconds(room_dur)})"
-            )
-            lines.append("")
+                f"({fmt(room_dur)})",
+                "",
+            ))
 
             # By cue type
             lines.append("  By Cue Type (what kind of elements are used here):")
             by_ct: Dict[CueType, Dict[str, Any]] = stats["by_cue_type"]
             if by_ct:
-                for ct in sorted(by_ct.keys(), key=lambda x: x.value):
+                for ct in sorted(by_ct.keys(), key=attrgetter("value")):
                     entry = by_ct[ct]
                     count = entry["count"]
                     dur = entry["total_duration"]
@@ -640,7 +1137,7 @@ class SummaryTab(QtWidgets.QWidget):
             lines.append("  By Trigger (how things start):")
             by_tr: Dict[TriggerType, Dict[str, Any]] = stats["by_trigger"]
             if by_tr:
-                for tt in sorted(by_tr.keys(), key=lambda x: x.value):
+                for tt in sorted(by_tr.keys(), key=attrgetter("value")):
                     entry = by_tr[tt]
                     lines.append(
                         f"    • {tt.value}: {entry['count']} cue(s) in this room"
@@ -653,7 +1150,7 @@ class SummaryTab(QtWidgets.QWidget):
             lines.append("  By Play Type (playback behaviour):")
             by_pl: Dict[PlayType, Dict[str, Any]] = stats["by_play"]
             if by_pl:
-                for pt in sorted(by_pl.keys(), key=lambda x: x.value):
+                for pt in sorted(by_pl.keys(), key=attrgetter("value")):
                     entry = by_pl[pt]
                     lines.append(
                         f"    • {pt.value}: {entry['count']} cue(s) in this room"
@@ -666,11 +1163,11 @@ class SummaryTab(QtWidgets.QWidget):
             notes_list: List[Tuple[float, str, str]] = stats["notes"]
             if notes_list:
                 lines.append("  Operator / design notes for this room:")
-                for start, cue_name, note in notes_list:
-                    lines.append(
-                        f"    • Around {start:.1f} s from the start of this room, "
-                        f"for cue “{cue_name}”: {note}"
-                    )
+                lines.extend(
+                    f"    • Around {start:.1f} s from the start of this room, "
+                    f"for cue “{cue_name}”: {note}"
+                    for start, cue_name, note in notes_list
+                )
                 lines.append("")
             else:
                 lines.append("  Operator / design notes for this room: (none)")
@@ -680,51 +1177,41 @@ class SummaryTab(QtWidgets.QWidget):
             lines.append("  Timeline for this room (local times):")
             timeline_entries: List[Tuple[float, MediaCue]] = stats["timeline"]
             if timeline_entries:
-                for start, cue in timeline_entries:
-                    duration = cue.duration_s
-                    dep = cue.dependency_name or "No specific dependency"
-                    lines.append(
-                        f"    • At {start:.1f} s from the start of this room "
-                        f"(lasting {duration:.1f} s): cue “{cue.name}” "
-                        f"[{cue.cue_type.value}] "
-                        f"– Triggered by: {cue.trigger_type.value}; "
-                        f"Play mode: {cue.play_type.value}; "
-                        f"Start rule: {cue.start_mode.value}; "
-                        f"Dependency: {dep}."
-                    )
+                lines.extend(
+                    f"    • At {start:.1f} s from the start of this room "
+                    f"(lasting {cue.duration_s:.1f} s): cue “{cue.name}” "
+                    f"[{cue.cue_type.value}] "
+                    f"– Triggered by: {cue.trigger_type.value}; "
+                    f"Play mode: {cue.play_type.value}; "
+                    f"Start rule: {cue.start_mode.value}; "
+                    f"Dependency: {cue.dependency_name or 'No specific dependency'}."
+                    for start, cue in timeline_entries
+                )
             else:
                 lines.append("    (no cues yet for this room)")
-            lines.append("")
-            lines.append("")
+            lines.extend(("", ""))
 
         # Global timeline dump (room-to-room)
-        lines.append("GLOBAL TIMELINE – RECEPTION TO MECCA")
-        lines.append("=" * 72)
-        lines.append(
+        lines.extend((
+            "GLOBAL TIMELINE – RECEPTION TO MECCA",
+            "=" * 72,
             "This section shows how the experience flows if the visitor moves "
             "from room to room in the planned order. Times are measured from "
-            "the very beginning of Reception."
-        )
-        lines.append("")
+            "the very beginning of Reception.",
+            "",
+        ))
         if global_items:
-            for item in sorted(global_items, key=lambda x: x.start_time):
-                cue = item.cue
-                dep = cue.dependency_name or "No specific dependency"
-                start_str = (
-                    f"{item.start_time:.1f} s "
-                    f"({self._format_seconds(item.start_time)})"
-                )
-                dur_str = (
-                    f"{item.duration:.1f} s "
-                    f"({self._format_seconds(item.duration)})"
-                )
-                lines.append(
-                    f"• At {start_str} from the very beginning, in room “{item.room_name}”, "
-                    f"cue “{cue.name}” starts. It lasts for {dur_str} and is of type "
-                    f"{cue.cue_type.value}. It is triggered by {cue.trigger_type.value}, "
-                    f"uses play mode {cue.play_type.value}, and follows the start rule "
-                    f"“{cue.start_mode.value}”. Dependency: {dep}."
-                )
+            lines.extend(
+                f"• At {item.start_time:.1f} s ({fmt(item.start_time)}) from the very "
+                f"beginning, in room “{item.room_name}”, "
+                f"cue “{item.cue.name}” starts. It lasts for "
+                f"{item.duration:.1f} s ({fmt(item.duration)}) and is of type "
+                f"{item.cue.cue_type.value}. It is triggered by {item.cue.trigger_type.value}, "
+                f"uses play mode {item.cue.play_type.value}, and follows the start rule "
+                f"“{item.cue.start_mode.value}”. "
+                f"Dependency: {item.cue.dependency_name or 'No specific dependency'}."
+                for item in sorted(global_items, key=attrgetter("start_time"))
+            )
         else:
             lines.append("There are currently no cues defined in any room.")
 
@@ -732,13 +1219,7 @@ class SummaryTab(QtWidgets.QWidget):
 
     @staticmethod
     def _format_seconds(seconds: float) -> str:
-        s = int(round(seconds))
-        h = s // 3600
-        m = (s % 3600) // 60
-        s2 = s % 60
-        if h > 0:
-            return f"{h:d}:{m:02d}:{s2:02d}"
-        return f"{m:02d}:{s2:02d}"
+        return _format_whole_seconds(int(round(seconds)))
 
     # -----------------------
     # PDF export
@@ -762,6 +1243,7 @@ class SummaryTab(QtWidgets.QWidget):
             - Remaining pages: text report (same content as in the GUI).
         """
         # Make sure the text report and internal stats are up to date
+        # (a no-op when nothing changed since the last refresh)
         self.refresh_summary()
 
         path_str, _ = QtWidgets.QFileDialog.getSaveFileName(
@@ -773,11 +1255,9 @@ class SummaryTab(QtWidgets.QWidget):
         if not path_str:
             return
 
-        # Lazy import so the app still runs if reportlab isn't installed.
-        try:
-            from reportlab.lib.pagesizes import A4, landscape
-            from reportlab.pdfgen import canvas
-        except Exception:  # noqa: BLE001
+        # Normally already imported by the preloader started in __init__
+        reportlab = _load_reportlab()
+        if reportlab is None:
             QtWidgets.QMessageBox.critical(
                 self,
                 "Missing dependency",
@@ -786,12 +1266,13 @@ class SummaryTab(QtWidgets.QWidget):
                 "    pip install reportlab",
             )
             return
+        A4, landscape, canvas = reportlab
 
         if not path_str.lower().endswith(".pdf"):
             path_str = path_str + ".pdf"
 
-        # Recompute data so we have everything locally here
-        global_items, room_stats, global_stats = self._compute_all_stats()
+        # Stats from the refresh above
+        global_items, room_stats, global_stats = self._stats
 
         page_size = landscape(A4)
         c = canvas.Canvas(path_str, pagesize=page_size)
@@ -803,75 +1284,62 @@ class SummaryTab(QtWidgets.QWidget):
         # ------------------------------------------------------
         # Shared helpers
         # ------------------------------------------------------
-        def pdf_color_for_cue_type(cue_type: CueType) -> tuple[float, float, float]:
-            """Colour palette for PDF bars (normalized 0–1)."""
-            if cue_type == CueType.AUDIO:
-                return (135 / 255.0, 206 / 255.0, 250 / 255.0)
-            if cue_type == CueType.PROJECTION:
-                return (255 / 255.0, 228 / 255.0, 181 / 255.0)
-            if cue_type == CueType.TV:
-                return (152 / 255.0, 251 / 255.0, 152 / 255.0)
-            if cue_type == CueType.LIGHTING:
-                return (255 / 255.0, 182 / 255.0, 193 / 255.0)
-            if cue_type == CueType.INTERACTIVE:
-                return (221 / 255.0, 160 / 255.0, 221 / 255.0)
-            if cue_type == CueType.ACTIVITY:
-                return (255 / 255.0, 215 / 255.0, 0 / 255.0)
-            if cue_type == CueType.GROUP_MOVEMENT:
-                return (64 / 255.0, 224 / 255.0, 208 / 255.0)
-            if cue_type == CueType.FACILITATOR_ACTION:
-                return (255 / 255.0, 165 / 255.0, 0 / 255.0)
-            return (211 / 255.0, 211 / 255.0, 211 / 255.0)
-
-        def compute_lanes(intervals: list[tuple[float, float]]) -> list[int]:
+        def draw_bars(
+            bars: list[tuple[MediaCue, float, float, float]],
+            bar_h: float,
+            line_width: float,
+        ) -> None:
             """
-            Generic greedy lane allocator.
+            Draw (cue, x0, bar_y, width) bars, then their labels.
 
-            intervals: list of (start, end) times.
-            Returns: lane index per interval.
+            Bars are grouped by cue type and each group is drawn as one
+            path, so the fill colour and the fill/stroke operators are
+            emitted once per type rather than once per bar. Where bars of
+            different types overlap, they stack by type, not in show order.
             """
-            n = len(intervals)
-            if n == 0:
-                return []
-
-            indices = list(range(n))
-            indices.sort(key=lambda i: intervals[i][0])
-
-            lane_end_times: list[float] = []
-            item_lane = [0] * n
-
-            for i in indices:
-                start, end = intervals[i]
-                placed = False
-                for lane_idx, lane_end in enumerate(lane_end_times):
-                    if start >= lane_end:
-                        item_lane[i] = lane_idx
-                        lane_end_times[lane_idx] = end
-                        placed = True
-                        break
-
-                if not placed:
-                    item_lane[i] = len(lane_end_times)
-                    lane_end_times.append(end)
-
-            return item_lane
+            by_type: Dict[CueType, list[tuple[float, float, float]]] = defaultdict(list)
+            for cue, x0, bar_y, width in bars:
+                by_type[cue.cue_type].append((x0, bar_y, width))
+
+            c.setStrokeColorRGB(0.1, 0.1, 0.1)
+            c.setLineWidth(line_width)
+            for cue_type, rects in by_type.items():
+                c.setFillColorRGB(*_PDF_CUE_COLORS.get(cue_type, _PDF_FALLBACK_COLOR))
+                path = c.beginPath()
+                for x0, bar_y, width in rects:
+                    path.rect(x0, bar_y, width, bar_h)
+                # Non-zero winding: with the default even-odd rule, where
+                # two same-type bars overlap (a lane reused exactly at a
+                # cue's end, or minimum-width bars) the overlap is unfilled
+                c.drawPath(path, stroke=1, fill=1, fillMode=canvas.FILL_NON_ZERO)
+
+            # Label inside each bar if there's room; crowded charts often
+            # have none, and then no text state is emitted at all
+            labelled = [bar for bar in bars if bar[3] > 40]
+            if not labelled:
+                return
+            c.setFont("Helvetica", 7)
+            c.setFillColorRGB(0.05, 0.05, 0.05)
+            text_dy = bar_h / 2.0 - 3
+            for cue, x0, bar_y, width in labelled:
+                label = cue.name
+                max_chars = int(width / 4.0)
+                if len(label) > max_chars:
+                    label = label[: max_chars - 3] + "..."
+                c.drawString(x0 + 2, bar_y + text_dy, label)
 
         # Rooms in show order (based on tab order)
-        room_order: list[str] = [
-            getattr(tab, "room_name", "Room")
-            for tab in self._room_tabs
-        ]
+        room_order: list[str] = [tab.room_name for tab in self._room_tabs]
 
-        # Map room -> its global items
-        from collections import defaultdict
+        # Map room -> its global items. They are built room by room, so
+        # each room is one contiguous run (extend still merges repeats).
         items_by_room: dict[str, list[GlobalTimelineItem]] = defaultdict(list)
-        for item in global_items:
-            items_by_room[item.room_name].append(item)
+        for room_name, room_items in groupby(global_items, key=attrgetter("room_name")):
+            items_by_room[room_name].extend(room_items)
 
-        # Only rooms that actually have cues (but keep order)
-        rooms_with_cues = [r for r in room_order if items_by_room.get(r)]
-        if not rooms_with_cues:
-            rooms_with_cues = room_order
+        # Only rooms that actually have cues (but keep order). Empty when
+        # there are no cues at all, so no per-room page work is done.
+        rooms_with_cues = [r for r in room_order if r in items_by_room]
 
         # ------------------------------------------------------
         # PAGE 1: title + GLOBAL GANTT (drawn from scratch)
@@ -926,8 +1394,13 @@ class SummaryTab(QtWidgets.QWidget):
                 t_clamped = max(0.0, min(t, max_end))
                 return chart_left + (t_clamped / max_end) * chart_width
 
-            # Per-room lanes for the global page
-            room_lane_info: dict[str, tuple[list[int], int]] = {}
+            # x_for_time_global inlined for the bar loop (max_end > 0 here)
+            x_scale = chart_width / max_end
+
+            # Per-room (items, lanes, lane count) for the global page
+            room_lane_info: dict[
+                str, tuple[list[GlobalTimelineItem], list[int], int]
+            ] = {}
             total_lanes_global = 0
             for room_name in rooms_with_cues:
                 items = items_by_room.get(room_name, [])
@@ -939,12 +1412,11 @@ class SummaryTab(QtWidgets.QWidget):
                         )
                         for it in items
                     ]
-                    lanes = compute_lanes(intervals)
-                    num_lanes = max(lanes) + 1 if lanes else 1
+                    lanes, num_lanes = compute_lanes(intervals)
                 else:
                     lanes = []
                     num_lanes = 1
-                room_lane_info[room_name] = (lanes, num_lanes)
+                room_lane_info[room_name] = (items, lanes, num_lanes)
                 total_lanes_global += num_lanes
 
             # Vertical sizing for global page
@@ -957,8 +1429,7 @@ class SummaryTab(QtWidgets.QWidget):
             current_row_index = 0  # accumulates lanes vertically from the top
 
             for room_name in rooms_with_cues:
-                items = items_by_room.get(room_name, [])
-                lanes, num_lanes = room_lane_info[room_name]
+                items, lanes, num_lanes = room_lane_info[room_name]
 
                 # Row range reserved for this room
                 room_first_row = current_row_index
@@ -996,35 +1467,18 @@ class SummaryTab(QtWidgets.QWidget):
                     continue
 
                 # Bars for this room
-                for idx, item in enumerate(items):
-                    lane_idx = lanes[idx] if idx < len(lanes) else 0
+                bars = []
+                half_bar = bar_height / 2.0
+                for item, lane_idx in zip(items, lanes):
                     lane_row = room_first_row + lane_idx
-                    lane_center_y = chart_top - row_height * (lane_row + 0.5)
-                    bar_y = lane_center_y - bar_height / 2.0
+                    bar_y = chart_top - row_height * (lane_row + 0.5) - half_bar
 
-                    cue = item.cue
                     start = item.start_time
                     end = start + max(item.duration, 0.0)
-                    x0 = x_for_time_global(start)
-                    x1 = x_for_time_global(end)
-                    width = max(3.0, x1 - x0)
-
-                    r, g, b = pdf_color_for_cue_type(cue.cue_type)
-                    c.setFillColorRGB(r, g, b)
-                    c.setStrokeColorRGB(0.1, 0.1, 0.1)
-                    c.setLineWidth(0.3)
-                    c.rect(x0, bar_y, width, bar_height, stroke=1, fill=1)
-
-                    # Label inside the bar if there's room
-                    if width > 40:
-                        c.setFont("Helvetica", 7)
-                        c.setFillColorRGB(0.05, 0.05, 0.05)
-                        text_y = bar_y + bar_height / 2.0 - 3
-                        label = cue.name
-                        max_chars = int(width / 4.0)
-                        if len(label) > max_chars:
-                            label = label[: max_chars - 3] + "..."
-                        c.drawString(x0 + 2, text_y, label)
+                    x0 = chart_left + min(max(start, 0.0), max_end) * x_scale
+                    x1 = chart_left + min(max(end, 0.0), max_end) * x_scale
+                    bars.append((item.cue, x0, bar_y, max(3.0, x1 - x0)))
+                draw_bars(bars, bar_height, 0.3)
 
             # Time axis
             axis_y = chart_bottom
@@ -1035,13 +1489,13 @@ class SummaryTab(QtWidgets.QWidget):
             c.setFont("Helvetica", 8)
             c.setFillColorRGB(0.2, 0.2, 0.25)
             num_ticks = 10
-            for i in range(num_ticks + 1):
-                t = (max_end / num_ticks) * i
-                x = x_for_time_global(t)
-                c.setLineWidth(0.5)
-                c.line(x, axis_y, x, axis_y + 4)
-                label = self._format_seconds(t)
-                c.drawCentredString(x, axis_y - 10, label)
+            tick_ts = [(max_end / num_ticks) * i for i in range(num_ticks + 1)]
+            tick_xs = [x_for_time_global(t) for t in tick_ts]
+            # All tick marks as one path, then their labels
+            c.setLineWidth(0.5)
+            c.lines([(x, axis_y, x, axis_y + 4) for x in tick_xs])
+            for x, t in zip(tick_xs, tick_ts):
+                c.drawCentredString(x, axis_y - 10, self._format_seconds(t))
 
             c.showPage()
 
@@ -1050,27 +1504,25 @@ class SummaryTab(QtWidgets.QWidget):
         # ------------------------------------------------------
         for room_name in rooms_with_cues:
             stats = room_stats.get(room_name)
-            if not stats:
-                continue
-            timeline_entries: list[tuple[float, MediaCue]] = stats.get("timeline", [])
+            timeline_entries: list[tuple[float, MediaCue]] | None = (
+                stats["timeline"] if stats else None
+            )
             if not timeline_entries:
                 continue
 
-            # Compute local max end time
-            max_room_end = 0.0
-            intervals_room: list[tuple[float, float]] = []
-            for start, cue in timeline_entries:
-                dur = max(cue.duration_s, 0.0)
-                end = start + dur
-                intervals_room.append((start, end))
-                max_room_end = max(max_room_end, end)
+            # (start, end) per entry, shared by the lanes and the bars;
+            # then the local max end time
+            intervals_room: list[tuple[float, float]] = [
+                (start, start + max(cue.duration_s, 0.0))
+                for start, cue in timeline_entries
+            ]
+            max_room_end = max(end for _, end in intervals_room)
 
             if max_room_end <= 0.0:
                 continue
 
             # Local lanes for this room
-            room_lanes = compute_lanes(intervals_room)
-            num_lanes_room = max(room_lanes) + 1 if room_lanes else 1
+            room_lanes, num_lanes_room = compute_lanes(intervals_room)
 
             # New page
             c.setPageSize(page_size)
@@ -1115,35 +1567,19 @@ class SummaryTab(QtWidgets.QWidget):
                 t_clamped = max(0.0, min(t, max_room_end))
                 return chart_left_r + (t_clamped / max_room_end) * chart_width_r
 
-            # Draw bars
-            c.setFont("Helvetica", 8)
-            for idx, (start, cue) in enumerate(timeline_entries):
-                lane_idx = room_lanes[idx] if idx < len(room_lanes) else 0
-                lane_center_y = chart_top_r - row_height_r * (lane_idx + 0.5)
-                bar_y = lane_center_y - bar_height_r / 2.0
-
-                dur = max(cue.duration_s, 0.0)
-                end = start + dur
-                x0 = x_for_time_room(start)
-                x1 = x_for_time_room(end)
-                width = max(4.0, x1 - x0)
-
-                r, g, b = pdf_color_for_cue_type(cue.cue_type)
-                c.setFillColorRGB(r, g, b)
-                c.setStrokeColorRGB(0.1, 0.1, 0.1)
-                c.setLineWidth(0.4)
-                c.rect(x0, bar_y, width, bar_height_r, stroke=1, fill=1)
-
-                # Label inside bar
-                if width > 40:
-                    c.setFont("Helvetica", 7)
-                    c.setFillColorRGB(0.05, 0.05, 0.05)
-                    text_y = bar_y + bar_height_r / 2.0 - 3
-                    label = cue.name
-                    max_chars = int(width / 4.0)
-                    if len(label) > max_chars:
-                        label = label[: max_chars - 3] + "..."
-                    c.drawString(x0 + 2, text_y, label)
+            # Draw bars (x_for_time_room inlined; max_room_end > 0 here)
+            x_scale_r = chart_width_r / max_room_end
+            half_bar_r = bar_height_r / 2.0
+            bars = []
+            for (_, cue), (start, end), lane_idx in zip(
+                timeline_entries, intervals_room, room_lanes
+            ):
+                bar_y = chart_top_r - row_height_r * (lane_idx + 0.5) - half_bar_r
+
+                x0 = chart_left_r + min(max(start, 0.0), max_room_end) * x_scale_r
+                x1 = chart_left_r + min(max(end, 0.0), max_room_end) * x_scale_r
+                bars.append((cue, x0, bar_y, max(4.0, x1 - x0)))
+            draw_bars(bars, bar_height_r, 0.4)
 
             # Time axis for room
             axis_y_r = chart_bottom_r
@@ -1155,13 +1591,13 @@ class SummaryTab(QtWidgets.QWidget):
             c.setFillColorRGB(0.2, 0.2, 0.25)
 
             num_ticks_r = 8
-            for i in range(num_ticks_r + 1):
-                t = (max_room_end / num_ticks_r) * i
-                x = x_for_time_room(t)
-                c.setLineWidth(0.5)
-                c.line(x, axis_y_r, x, axis_y_r + 4)
-                label = self._format_seconds(t)
-                c.drawCentredString(x, axis_y_r - 10, label)
+            tick_ts = [(max_room_end / num_ticks_r) * i for i in range(num_ticks_r + 1)]
+            tick_xs = [x_for_time_room(t) for t in tick_ts]
+            # All tick marks as one path, then their labels
+            c.setLineWidth(0.5)
+            c.lines([(x, axis_y_r, x, axis_y_r + 4) for x in tick_xs])
+            for x, t in zip(tick_xs, tick_ts):
+                c.drawCentredString(x, axis_y_r - 10, self._format_seconds(t))
 
             c.showPage()
 
@@ -1172,16 +1608,29 @@ class SummaryTab(QtWidgets.QWidget):
         y = page_height - margin
 
         report_text = self.summary_edit.toPlainText()
-        lines = self._wrap_text(report_text, max_len=110)
+        lines = _wrap_text(report_text, max_len=110)
+
+        # (font, size, fill colour, line step) per kind of report line
+        top_style = ("Helvetica-Bold", 12, (0.18, 0.35, 0.65), 16)
+        room_style = ("Helvetica-Bold", 11, (0.14, 0.30, 0.55), 14)
+        sub_style = ("Helvetica-Bold", 9.5, (0.25, 0.40, 0.70), 12)
+        body_style = ("Helvetica", 9, (0.10, 0.10, 0.10), 11)
+
+        # One text object (a single BT/ET block) per page; font and colour
+        # are only re-emitted when the line style changes.
+        text = c.beginText()
+        style = None
 
         for raw in lines:
             line = raw.rstrip("\n")
             stripped = line.strip()
 
             if y < margin:
+                c.drawText(text)
                 c.showPage()
-                page_width, page_height = page_size
                 y = page_height - margin
+                text = c.beginText()
+                style = None
 
             if not stripped:
                 y -= 6
@@ -1192,42 +1641,25 @@ class SummaryTab(QtWidgets.QWidget):
                 and len(stripped) <= 70
             )
 
-            is_room_heading = stripped.startswith("ROOM:")
-            subheading_keywords = (
-                "Cues by Cue Type",
-                "Cues by Trigger Type",
-                "Cues by Play Type",
-                "By Cue Type",
-                "By Trigger",
-                "By Play Type",
-                "Operator / design notes",
-                "Timeline for this room",
-            )
-            is_subheading = any(
-                stripped.lstrip().startswith(k) for k in subheading_keywords
-            )
-
             if is_top_heading:
-                c.setFont("Helvetica-Bold", 12)
-                c.setFillColorRGB(0.18, 0.35, 0.65)
-                c.drawString(margin, y, stripped)
-                y -= 16
-            elif is_room_heading:
-                c.setFont("Helvetica-Bold", 11)
-                c.setFillColorRGB(0.14, 0.30, 0.55)
-                c.drawString(margin, y, stripped)
-                y -= 14
-            elif is_subheading:
-                c.setFont("Helvetica-Bold", 9.5)
-                c.setFillColorRGB(0.25, 0.40, 0.70)
-                c.drawString(margin, y, stripped)
-                y -= 12
+                line_style, out = top_style, stripped
+            elif stripped.startswith("ROOM:"):
+                line_style, out = room_style, stripped
+            elif stripped.startswith(_REPORT_SUBHEADINGS):
+                line_style, out = sub_style, stripped
             else:
-                c.setFont("Helvetica", 9)
-                c.setFillColorRGB(0.10, 0.10, 0.10)
-                c.drawString(margin, y, line)
-                y -= 11
-
+                line_style, out = body_style, line
+
+            font, size, rgb, step = line_style
+            if line_style is not style:
+                text.setFont(font, size)
+                text.setFillColorRGB(*rgb)
+                style = line_style
+            text.setTextOrigin(margin, y)
+            text.textOut(out)
+            y -= step
+
+        c.drawText(text)
         c.save()
 
         # Styled export-complete dialog
@@ -1262,58 +1694,3 @@ class SummaryTab(QtWidgets.QWidget):
             }
         """)
         msg.exec_()
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-    @staticmethod
-    def _wrap_text(text: str, max_len: int = 110) -> List[str]:
-        """
-        Simple word-wrapping for the PDF text output.
-
-        Tries to preserve headings and indentation while wrapping long
-        body lines to a reasonable width.
-        """
-        out_lines: List[str] = []
-        for raw_line in text.splitlines():
-            line = raw_line.rstrip()
-            stripped = line.strip()
-
-            # Short lines (headings or bullets) are kept as-is.
-            if len(stripped) <= max_len:
-                out_lines.append(line)
-                continue
-
-            # Wrap only long lines, preserving leading indentation
-            leading_spaces = len(line) - len(line.lstrip(" "))
-            indent = " " * leading_spaces
-            words = stripped.split(" ")
-
-            current: List[str] = []
-            current_len = 0
-            for w in words:
-                extra = len(w) + (1 if current else 0)
-                if current_len + extra > max_len - leading_spaces:
-                    out_lines.append(indent + " ".join(current))
-                    current = [w]
-                    current_len = len(w)
-                else:
-                    current.append(w)
-                    current_len += extra
-            if current:
-                out_lines.append(indent + " ".join(current))
-
-        return out_lines
@@ -0,0 +1,23 @@
+"""Shared pytest setup: import path and a headless QApplication."""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# The app's modules live at the repository root, next to this folder
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# Render without a display
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """One QApplication for the whole test session."""
+    QtWidgets = pytest.importorskip("PyQt5.QtWidgets")
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    yield app
@@ -0,0 +1,53 @@
+"""Tests for the per-room timeline."""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("PyQt5")
+
+from main import RoomPlaceholder
+from models import CueType, MediaCue, StartMode
+from room_tab import RoomTab, TimelineView
+
+
+def test_export_render_leaves_view_scene_untouched(qapp):
+    view = TimelineView()
+    view.set_cues([
+        MediaCue("Intro audio", duration_s=40.0),
+        MediaCue("Lights", cue_type=CueType.LIGHTING, start_time_s=10.0, duration_s=30.0),
+    ])
+    view.render_to_image(800, 200)
+    scene_rect = view.scene().sceneRect()
+    item_count = len(view.scene().items())
+
+    image = view.render_to_image_with_sizes(1200, 400, bar_height=40.0, lane_gap=16.0)
+
+    assert (image.width(), image.height()) == (1200, 400)
+    assert view.scene().sceneRect() == scene_rect
+    assert len(view.scene().items()) == item_count
+    # Nothing rendered off-screen is left behind as a top-level widget
+    assert not [
+        w for w in qapp.topLevelWidgets()
+        if isinstance(w, TimelineView) and w is not view
+    ]
+
+
+def test_placeholder_and_room_tab_share_cue_state(qapp):
+    cues = [
+        MediaCue("Intro audio", duration_s=40.0),
+        MediaCue("Video", start_mode=StartMode.AFTER_PREVIOUS, duration_s=20.0),
+    ]
+    placeholder = RoomPlaceholder("Hall")
+    tab = RoomTab("Hall")
+    for room in (placeholder, tab):
+        room.set_cues(cues)
+
+    assert placeholder.get_schedule() == tab.get_schedule() == [0.0, 40.0]
+    assert placeholder.get_json_bytes() == tab.get_json_bytes()
+
+    # Cached JSON is dropped once the cues change
+    before = tab.get_json_bytes()
+    tab.set_cues(cues[:1])
+    assert tab.get_json_bytes() != before
+    assert tab.get_schedule() == [0.0]
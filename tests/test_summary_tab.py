@@ -0,0 +1,81 @@
+"""Tests for the Summary tab."""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("PyQt5")
+
+from main import RoomPlaceholder
+from models import CueType, MediaCue, StartMode
+from summary_tab import SummaryTab
+
+
+def _room(name: str, cues: list[MediaCue]) -> RoomPlaceholder:
+    room = RoomPlaceholder(name)
+    room.set_cues(cues)
+    return room
+
+
+def test_refresh_summary_swaps_report_document(qapp):
+    room = _room("Reception", [MediaCue("Welcome audio", duration_s=30.0)])
+    # __init__ already ran the first refresh (replacing the default document)
+    tab = SummaryTab([room])
+    first_doc = tab.summary_edit.document()
+    assert "Welcome audio" in tab.summary_edit.toPlainText()
+
+    room.set_cues([
+        MediaCue("Welcome audio", duration_s=30.0),
+        MediaCue(
+            "Lights up",
+            cue_type=CueType.LIGHTING,
+            start_mode=StartMode.AFTER_PREVIOUS,
+            duration_s=10.0,
+        ),
+    ])
+    tab.refresh_summary()
+
+    assert tab.summary_edit.document() is not first_doc
+    assert "Lights up" in tab.summary_edit.toPlainText()
+
+
+def _inked_columns(image) -> set[int]:
+    """x coordinates of every non-transparent pixel in image."""
+    return {
+        x
+        for x in range(image.width())
+        for y in range(image.height())
+        if image.pixelColor(x, y).alpha()
+    }
+
+
+def test_labels_overlay_paints_only_exposed_labels(qapp):
+    from PyQt5 import QtCore, QtGui, QtWidgets
+
+    from summary_tab import _LabelsOverlayItem
+
+    overlay = _LabelsOverlayItem(QtCore.QRectF(0, 0, 600, 40))
+    overlay.add_group(
+        QtGui.QFont("Segoe UI", 8),
+        QtGui.QColor(0, 0, 0),
+        [(QtCore.QPointF(500, 10), "Far"), (QtCore.QPointF(10, 10), "Near")],
+    )
+
+    def paint(exposed: QtCore.QRectF | None) -> set[int]:
+        image = QtGui.QImage(600, 40, QtGui.QImage.Format_ARGB32)
+        image.fill(QtCore.Qt.transparent)
+        painter = QtGui.QPainter(image)
+        if exposed is None:
+            overlay.paint_labels(painter)
+        else:
+            option = QtWidgets.QStyleOptionGraphicsItem()
+            option.exposedRect = exposed
+            overlay.paint(painter, option)
+        painter.end()
+        return _inked_columns(image)
+
+    culled = paint(QtCore.QRectF(0, 0, 100, 40))
+    assert culled and max(culled) < 100
+
+    # The export path still paints every label
+    assert max(paint(None)) >= 500